@@ -7,6 +7,7 @@ import {
   PageNode,
   NavigationEdge,
   GameEvent,
+  GameStartedEvent,
   GameMoveCompletedEvent,
   OptimalPathsUpdatedEvent,
   GameEndedEvent,
@@ -91,6 +92,9 @@ export class TaskManager {
       case 'CONNECTION_ESTABLISHED':
         this.handleConnectionEstablished(player, event as ConnectionEstablishedEvent);
         break;
+      case 'GAME_STARTED':
+        this.handleGameStarted(player, event as GameStartedEvent);
+        break;
       case 'GAME_MOVE_COMPLETED':
         this.handleMoveCompleted(player, event as GameMoveCompletedEvent);
         break;
@@ -172,6 +176,13 @@ export class TaskManager {
     this.notifyListeners();
   }
 
+  private handleGameStarted(player: Player, event: GameStartedEvent): void {
+    // Games wait for a free slot on the server, so this can arrive well after the task starts
+    console.log('🚦 TaskManager: handling game started for game', player.gameId);
+    player.gameSequence.status = event.status;
+    this.notifyListeners();
+  }
+
   private handleMoveCompleted(player: Player, event: GameMoveCompletedEvent): void {
     console.log('👟 TaskManager: handling move completed for game', player.gameId);
     
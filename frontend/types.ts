@@ -140,6 +140,14 @@ export interface ConnectionEstablishedEvent extends BaseGameEvent {
   };
 }
 
+export interface GameStartedEvent extends BaseGameEvent {
+  type: 'GAME_STARTED';
+  start_page: string;
+  target_page: string;
+  status: string;
+  steps: number;
+}
+
 export interface GameMoveCompletedEvent extends BaseGameEvent {
   type: 'GAME_MOVE_COMPLETED';
   move: Move;
@@ -202,6 +210,7 @@ export interface TaskEndedEvent extends BaseGameEvent {
 
 export type GameEvent = 
   | ConnectionEstablishedEvent
+  | GameStartedEvent
   | GameMoveCompletedEvent 
   | OptimalPathsUpdatedEvent 
   | GameEndedEvent
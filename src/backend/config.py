@@ -169,6 +169,7 @@ class BackendConfig(BaseModel):
     # Game settings
     default_max_steps: int = 30
     max_concurrent_games: int = 10
+    max_concurrent_model_requests: int = 8  # only enforced when below max_concurrent_games
     
     # MCP server settings - reuse from existing config
     mcp_server_name: str = "stdio_mcp_server"
@@ -182,7 +183,8 @@ class BackendConfig(BaseModel):
             debug=os.getenv("BACKEND_DEBUG", "false").lower() == "true",
             cors_origins=os.getenv("CORS_ORIGINS", "http://localhost:3000,http://localhost:5173").split(","),
             default_max_steps=int(os.getenv("DEFAULT_MAX_STEPS", "30")),
-            max_concurrent_games=int(os.getenv("MAX_CONCURRENT_GAMES", "10"))
+            max_concurrent_games=int(os.getenv("MAX_CONCURRENT_GAMES", "10")),
+            max_concurrent_model_requests=int(os.getenv("MAX_CONCURRENT_MODEL_REQUESTS", "8")),
         )
 
 # Global config instance
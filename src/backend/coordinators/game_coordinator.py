@@ -30,9 +30,23 @@ class GameCoordinator:
     - Storage (handled by StorageHandler)
     """
     
-    def __init__(self, event_bus: EventBus, wiki_service: LiveWikiService):
+    def __init__(
+        self,
+        event_bus: EventBus,
+        wiki_service: LiveWikiService,
+        max_concurrent_games: int = 10,
+        max_concurrent_model_requests: int = 8,
+    ):
         self.event_bus = event_bus
         self.wiki_service = wiki_service
+        # Games beyond this many wait for a slot before their first turn
+        self.game_slots = asyncio.Semaphore(max_concurrent_games)
+        # Shared by every game so the total number of in-flight model requests stays bounded.
+        # A game has at most one request in flight, so a limit at or above the game cap could
+        # never be reached; only create the limiter when it is tighter than game_slots.
+        self.model_request_limiter: Optional[asyncio.Semaphore] = None
+        if max_concurrent_model_requests < max_concurrent_games:
+            self.model_request_limiter = asyncio.Semaphore(max_concurrent_model_requests)
         self.active_games: Dict[str, Game] = {} # { game_id: Game }
         # background was because we thought we would support an interactive mode (viewer can step through)
         # TODO(hunter): refactor this as everything is background now
@@ -65,6 +79,7 @@ class GameCoordinator:
                 start_page=start_page,
                 tools=tools,
                 event_bus=self.event_bus,
+                request_limiter=self.model_request_limiter,
             )
             initial_state = game.state
         except Exception as e:
@@ -158,8 +173,12 @@ class GameCoordinator:
             return
 
         try:
-            logger.info(f"Starting background execution for game {game_id}")
-            await game.run()
+            if self.game_slots.locked():
+                logger.info(f"Game {game_id} queued until a game slot frees up")
+            async with self.game_slots:
+                logger.info(f"Starting background execution for game {game_id}")
+                # Game.run publishes game_started once the game leaves the queue
+                await game.run()
             logger.info(f"Background game {game_id} completed with status: {game.state.status.value if game.state else 'not_found'}")
                 
         except asyncio.CancelledError:
@@ -3,7 +3,7 @@ import logging
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
-from wiki_arena import GameEvent, EventBus
+from wiki_arena import GameEvent, EventBus, GameStateView
 from wiki_arena.solver import WikiTaskSolver
 
 logger = logging.getLogger(__name__)
@@ -47,7 +47,7 @@ class SolverHandler:
         logger.debug(f"Triggering task solver for game {event.game_id}")
         
         # Extract necessary data
-        game_state = event.data.get("game_state")
+        game_state: GameStateView = event.data.get("game_state")
         move = event.data.get("move")
         
         if not game_state or not move:
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Optional
 
@@ -44,7 +45,8 @@ class StorageHandler:
             game_result = GameResult.from_game_state(game_state, model_config.id)
             
             # Store the game result
-            success = self.storage_service.store_game(game_result)
+            # Write from a worker thread so disk I/O doesn't stall the event loop
+            success = await asyncio.to_thread(self.storage_service.store_game, game_result)
             
             if success:
                 logger.info(f"Successfully stored game {event.game_id} ({game_result.status.value})")
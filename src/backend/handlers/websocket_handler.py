@@ -1,7 +1,7 @@
 import logging
 from typing import Dict, Any
 
-from wiki_arena import GameEvent
+from wiki_arena import GameEvent, GameStateView
 from wiki_arena.types import GameState, Move, GameResult
 from wiki_arena.openrouter import OpenRouterModelConfig
 from backend.websockets.game_hub import websocket_manager
@@ -61,7 +61,7 @@ class WebSocketHandler:
         
         # Extract data from event
         move: Move = event.data.get("move")
-        game_state: GameState = event.data.get("game_state")
+        game_state: GameStateView = event.data.get("game_state")
         
         # Create WebSocket message
         message = {
@@ -83,23 +83,23 @@ class WebSocketHandler:
         
         logger.info(f"Broadcasted move to {websocket_manager.get_connection_count(event.game_id)} clients for game {event.game_id}")
 
-    # async def handle_game_started(self, event: GameEvent):
-    #     """Handle game_started events by broadcasting to WebSocket clients."""
-    #     logger.debug(f"Broadcasting game_started for game {event.game_id}")
-        
-    #     game_state_data = event.data.get("game_state")
-        
-    #     message = {
-    #         "type": "GAME_STARTED",
-    #         "game_id": event.game_id,
-    #         "start_page": game_state_data.config.start_page_title,
-    #         "target_page": game_state_data.config.target_page_title,
-    #         "status": game_state_data.status.value,
-    #         "steps": game_state_data.steps
-    #     }
-        
-    #     await websocket_manager.broadcast_to_game(event.game_id, message)
-    #     logger.info(f"Broadcasted game_started to clients for game {event.game_id}")
+    async def handle_game_started(self, event: GameEvent):
+        """Handle game_started events by broadcasting to WebSocket clients."""
+        logger.debug(f"Broadcasting game_started for game {event.game_id}")
+        
+        game_state_data: GameStateView = event.data.get("game_state")
+        
+        message = {
+            "type": "GAME_STARTED",
+            "game_id": event.game_id,
+            "start_page": game_state_data.config.start_page_title,
+            "target_page": game_state_data.config.target_page_title,
+            "status": game_state_data.status.value,
+            "steps": game_state_data.steps
+        }
+        
+        await websocket_manager.broadcast_to_game(event.game_id, message)
+        logger.info(f"Broadcasted game_started to clients for game {event.game_id}")
     
     async def handle_game_ended(self, event: GameEvent):
         """Handle game_ended events by broadcasting final status to WebSocket clients."""
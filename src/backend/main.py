@@ -48,7 +48,12 @@ async def lifespan(app: FastAPI):
     logger.info("WikiTaskSolver created with cleanup task started")
     
     # Create coordinators
-    game_coordinator = GameCoordinator(event_bus, wiki_service)
+    game_coordinator = GameCoordinator(
+        event_bus,
+        wiki_service,
+        max_concurrent_games=config.max_concurrent_games,
+        max_concurrent_model_requests=config.max_concurrent_model_requests,
+    )
     task_coordinator = TaskCoordinator(event_bus, game_coordinator)
     
     # Create event handlers with dependencies
@@ -70,6 +75,7 @@ async def lifespan(app: FastAPI):
     event_bus.subscribe("task_solved", task_coordinator.handle_task_solved) # start games (old handle_initial_paths_ready)
     event_bus.subscribe("task_solved", websocket_handler.handle_task_solved) # send shortest paths to frontend for all games under that task
 
+    event_bus.subscribe("game_started", websocket_handler.handle_game_started) # tell clients a queued game got a slot
     event_bus.subscribe("move_completed", websocket_handler.handle_move_completed) # broadcast move to all clients
     event_bus.subscribe("move_completed", solver_handler.handle_move_completed) # solve new subtask
     event_bus.subscribe("shortest_paths_found", websocket_handler.handle_shortest_paths_found) # broadcast optimal paths to all clients
@@ -97,8 +103,10 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down Wiki Arena API...")
     await game_coordinator.shutdown()
+    await event_bus.shutdown()  # Deliver events queued by finished games (e.g. game_ended -> storage)
     await task_coordinator.shutdown()
     await solver.shutdown()  # Ensure cleanup task is cancelled
+    await wiki_service.aclose()  # Release the shared Wikipedia connection pool
     logger.info("Wiki Arena API shutdown complete")
 
 # Create FastAPI app
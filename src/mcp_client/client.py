@@ -1,5 +1,4 @@
-import asyncio
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any
 import logging
 
 from mcp.types import ListToolsResult, CallToolResult
@@ -13,6 +12,8 @@ class MCPClient:
         self._exit_stack: Optional[AsyncExitStack] = None
         self._is_connected = False
         self._server_params: Optional[StdioServerParameters] = None
+        # The server's tool list is fixed for a session, so it is fetched once per connection
+        self._tools_cache: Optional[ListToolsResult] = None
 
     async def connect(self, server_params: StdioServerParameters):
         """Establishes a connection to the MCP server."""
@@ -63,6 +64,7 @@ class MCPClient:
                 logging.debug(f"Error during exit stack cleanup: {e}")
         self._is_connected = False
         self._server_params = None
+        self._tools_cache = None
         
         logging.info("Disconnected.")
 
@@ -71,8 +73,14 @@ class MCPClient:
         if not self._session:
             logging.warning("Attempted to list tools while not connected.")
             raise ConnectionError("Not connected to server.")
-        logging.debug("Listing tools...")
-        return await self._session.list_tools()
+        if self._tools_cache is None:
+            logging.debug("Listing tools...")
+            self._tools_cache = await self._session.list_tools()
+        return self._tools_cache
+
+    def invalidate_tools_cache(self):
+        """Forces the next `list_tools` call to query the server again."""
+        self._tools_cache = None
 
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> CallToolResult:
         """Calls a specific tool on the connected server."""
@@ -14,6 +14,9 @@ setup_logging(level="INFO")
 # Configure the server for stateless HTTP to enable testing
 mcp = FastMCP("wiki-arena")
 
+# One service for the lifetime of the server so tool calls reuse its connection pool
+wiki_service = LiveWikiService(language="en")
+
 @mcp.tool()
 async def navigate(page: str) -> List[Union[types.TextContent, types.EmbeddedResource]]:
     """
@@ -29,17 +32,15 @@ async def navigate(page: str) -> List[Union[types.TextContent, types.EmbeddedRes
         All available links on the page
     """
     # Use the centralized service to fetch page data
-    wiki_service = LiveWikiService(language="en")
     page_data = await wiki_service.get_page(page, include_all_namespaces=False)
     
     # Format links for display - preserve exact order
     if page_data.links:
-        links_display = "\n".join(page_data.links)
         summary = f"""Current Page: {page_data.title}
 Total Links: {len(page_data.links)}
 
 Available Links:
-{links_display}"""
+{page_data.links_block}"""
     else:
         summary = f"Current Page: {page_data.title}\nNo links found on this page."
     
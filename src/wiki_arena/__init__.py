@@ -5,6 +5,6 @@ A standalone Python package containing all the logic required to run and analyze
 a Wikipedia navigation game.
 """
 
-from .events import EventBus, GameEvent
+from .events import EventBus, GameEvent, GameStateView
 
-__all__ = ['EventBus', 'GameEvent']
+__all__ = ['EventBus', 'GameEvent', 'GameStateView']
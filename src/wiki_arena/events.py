@@ -1,22 +1,54 @@
 import asyncio
 import logging
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Callable, Awaitable, Any, Optional
-from collections import defaultdict
-from pydantic import BaseModel, Field
-
-class GameEvent(BaseModel):
-    """Event emitted during game execution."""
-    type: str = Field(..., min_length=1, description="Event type identifier (e.g., 'move_completed', 'game_ended')")
-    game_id: str = Field(..., min_length=1, description="Unique identifier for the game")
-    data: Dict[str, Any] = Field(..., description="Event payload containing relevant event data")
-    timestamp: datetime = Field(default_factory=datetime.now, description="When the event was created")
-    
-    class Config:
-        # Allow arbitrary types in data field (for Move, GameState objects)
-        arbitrary_types_allowed = True
-        # Use enum values for serialization
-        use_enum_values = True
+from typing import Deque, Dict, Tuple, Callable, Awaitable, Any, Optional
+
+from wiki_arena.types import GameConfig, GameState, GameStatus, Page
+
+@dataclass(slots=True)
+class GameEvent:
+    """
+    Event emitted during game execution.
+
+    A plain dataclass rather than a pydantic model: events are an internal envelope
+    created on every move, and `data` carries arbitrary objects (Move, GameState)
+    that never need validating or serializing here.
+    """
+    type: str  # Event type identifier (e.g., 'move_completed', 'game_ended')
+    game_id: str  # Unique identifier for the game
+    data: Dict[str, Any]  # Event payload containing relevant event data
+    timestamp: datetime = field(default_factory=datetime.now)  # When the event was created
+
+@dataclass(slots=True, frozen=True)
+class GameStateView:
+    """
+    Point-in-time snapshot of the parts of a GameState that move subscribers read.
+
+    Events are delivered in the background, so handing subscribers the live GameState
+    would let them observe later turns. The view copies only scalars and references to
+    objects that never change after creation (the config and the fetched page).
+    """
+    game_id: str
+    config: GameConfig
+    current_page: Page
+    steps: int
+    status: GameStatus
+
+    @classmethod
+    def from_state(cls, state: GameState) -> "GameStateView":
+        return cls(
+            game_id=state.game_id,
+            config=state.config,
+            current_page=state.current_page,
+            steps=state.steps,
+            status=state.status,
+        )
+
+EventHandler = Callable[[GameEvent], Awaitable[None]]
+
+_NO_HANDLERS: Tuple[EventHandler, ...] = ()
 
 class EventBus:
     """
@@ -24,45 +56,105 @@ class EventBus:
     
     Supports async event handlers with error isolation - if one handler fails,
     others continue to run.
+
+    Producers on a latency-sensitive path (the game loop) can use `publish_nowait`,
+    which queues the event for background delivery. Each game gets its own consumer, so
+    a game's events arrive in the order they were queued, a slow subscriber no longer
+    delays the producer, and one game's backlog never holds up another game's events.
     """
     
     def __init__(self):
-        self._subscribers: Dict[str, List[Callable[[GameEvent], Awaitable[None]]]] = defaultdict(list)
+        # Handlers are stored as immutable tuples, rebuilt on subscribe, so publish can
+        # iterate them directly and lookups for unknown event types don't insert entries.
+        self._subscribers: Dict[str, Tuple[EventHandler, ...]] = {}
         self.logger = logging.getLogger(__name__)
+        # Background delivery for publish_nowait: one pending queue and consumer task per
+        # game, created on the running loop and removed once that game's queue empties.
+        # Queues are unbounded on purpose: events such as game_ended must never be dropped,
+        # and a game produces at most a couple of events per model call, so a queue only
+        # grows while that game's own subscribers are slower than its model.
+        self._pending: Dict[str, Deque[GameEvent]] = {}
+        self._consumers: Dict[str, asyncio.Task] = {}
+        self._consumer_loop: Optional[asyncio.AbstractEventLoop] = None
     
-    def subscribe(self, event_type: str, handler: Callable[[GameEvent], Awaitable[None]]):
+    def subscribe(self, event_type: str, handler: EventHandler):
         """Subscribe a handler to an event type."""
-        self._subscribers[event_type].append(handler)
+        self._subscribers[event_type] = self._subscribers.get(event_type, _NO_HANDLERS) + (handler,)
         self.logger.debug(f"Subscribed handler to {event_type}")
     
     async def publish(self, event: GameEvent):
         """Publish an event to all subscribers."""
-        handlers = self._subscribers[event.type]
+        handlers = self._subscribers.get(event.type, _NO_HANDLERS)
         if not handlers:
             self.logger.debug(f"No subscribers for event type: {event.type}")
             return
             
         self.logger.debug(f"Publishing {event.type} to {len(handlers)} handlers")
+
+        # Single subscriber (the common case): await it directly and skip gather's task setup
+        if len(handlers) == 1:
+            await self._safe_handle(handlers[0], event)
+            return
         
-        # Run all handlers concurrently with error isolation
-        results = await asyncio.gather(
-            *[self._safe_handle(handler, event) for handler in handlers],
-            return_exceptions=True
-        )
-        
-        # Log any errors but don't fail the publish operation
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                self.logger.error(f"Event handler {i} failed for {event.type}: {result}")
+        # Run all handlers concurrently with error isolation. _safe_handle logs and
+        # swallows handler errors itself, so there is nothing left to inspect here.
+        await asyncio.gather(*(self._safe_handle(handler, event) for handler in handlers))
+    
+    def publish_nowait(self, event: GameEvent) -> None:
+        """Queue an event for background delivery without waiting for its handlers."""
+        if not self._subscribers.get(event.type):
+            self.logger.debug(f"No subscribers for event type: {event.type}")
+            return
+
+        loop = asyncio.get_running_loop()
+        if self._consumer_loop is not loop:
+            self._pending = {}
+            self._consumers = {}
+            self._consumer_loop = loop
+
+        pending = self._pending.get(event.game_id)
+        if pending is None:
+            pending = self._pending[event.game_id] = deque()
+            self._consumers[event.game_id] = loop.create_task(self._consume(event.game_id, pending))
+        pending.append(event)
+
+    async def _consume(self, game_id: str, pending: Deque[GameEvent]) -> None:
+        """Deliver one game's queued events in publish order, then retire the consumer."""
+        try:
+            while pending:
+                await self.publish(pending[0])
+                pending.popleft()
+        finally:
+            # Nothing is awaited between the empty check and here, so no event can be
+            # queued for this game after its consumer has decided to stop.
+            if self._pending.get(game_id) is pending:
+                del self._pending[game_id]
+                del self._consumers[game_id]
+
+    async def drain(self) -> None:
+        """Wait until every event queued with publish_nowait has been delivered."""
+        if self._consumer_loop is not asyncio.get_running_loop():
+            return
+        # Handlers may queue further events, which start new consumers
+        while self._consumers:
+            await asyncio.gather(*self._consumers.values())
+
+    async def shutdown(self) -> None:
+        """Deliver any queued events and release the background consumers."""
+        await self.drain()
+        self._pending = {}
+        self._consumers = {}
+        self._consumer_loop = None
     
-    async def _safe_handle(self, handler: Callable, event: GameEvent):
-        """Run a handler with error isolation."""
+    async def _safe_handle(self, handler: Callable, event: GameEvent) -> Optional[Exception]:
+        """Run a handler with error isolation, returning (not raising) any exception it hit."""
         try:
             await handler(event)
         except Exception as e:
-            self.logger.error(f"Handler {handler.__name__} failed: {e}", exc_info=True)
-            raise  # Re-raise so gather() can catch it as exception
+            self.logger.error(f"Handler {handler.__name__} failed for {event.type}: {e}", exc_info=True)
+            return e
+        return None
     
     def get_subscriber_count(self, event_type: str) -> int:
         """Get number of subscribers for an event type (useful for testing)."""
-        return len(self._subscribers[event_type]) 
\ No newline at end of file
+        return len(self._subscribers.get(event_type, _NO_HANDLERS))
\ No newline at end of file
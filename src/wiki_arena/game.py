@@ -1,10 +1,11 @@
-import random
-import logging
-from datetime import datetime
-from typing import Optional, List, Tuple
-import uuid
 import asyncio
-import json
+import contextlib
+import logging
+import itertools
+import time
+from collections import namedtuple
+from functools import lru_cache
+from typing import Optional, List
 
 from wiki_arena.types import (
     GameConfig,
@@ -17,9 +18,9 @@ from wiki_arena.types import (
     SystemMessage,
     UserMessage,
     ToolResultMessage,
-    AssistantToolCall,
+    ContextMessage,
 )
-from wiki_arena.events import EventBus, GameEvent
+from wiki_arena.events import EventBus, GameEvent, GameStateView
 from wiki_arena.wikipedia import LiveWikiService
 from wiki_arena.language_models import LanguageModel, LLMProviderError
 from wiki_arena.tools import get_tool_by_name
@@ -27,6 +28,41 @@ from wiki_arena.tools import get_tool_by_name
 
 logger = logging.getLogger(__name__)
 
+_game_id_counter = itertools.count()
+
+# A tool's implementation and required argument names, resolved once per game
+ToolEntry = namedtuple("ToolEntry", "impl required")
+
+def _approx_tokens(message: ContextMessage) -> int:
+    """Rough token count for context budgeting (about four characters per token)."""
+    return len(message.content or "") // 4
+
+
+# Stand-in for a request limiter when the game isn't sharing one
+_NO_REQUEST_LIMIT = contextlib.nullcontext()
+
+
+# Messages built by the game loop are known-good, so skip pydantic validation for them.
+def _tool_error(tool_call_id: str, content: str) -> ToolResultMessage:
+    """Build an error tool result for a rejected or failed tool call."""
+    return ToolResultMessage.model_construct(tool_call_id=tool_call_id, content=content, is_error=True)
+
+
+@lru_cache(maxsize=256)
+def _system_message(template: str, start_page_title: str, target_page_title: str) -> SystemMessage:
+    """Render the system prompt for a task.
+
+    Tournaments play the same task with many models, so the rendered message is cached and
+    shared between games. Context messages are never mutated, so sharing them is safe.
+    """
+    return SystemMessage(
+        content=template.format(start_page_title=start_page_title, target_page_title=target_page_title)
+    )
+
+
+# Only the message of a turn's last error is kept, so the fixed no-tool-call error can be shared
+_ERR_NO_TOOL_CALL = GameError(type=ErrorType.MODEL_NO_TOOL_CALL, message="Model did not call a tool.")
+
 
 class Game:
     def __init__(
@@ -37,13 +73,42 @@ class Game:
         start_page: Page,
         tools: List[dict],
         event_bus: Optional[EventBus] = None,
+        request_limiter: Optional[asyncio.Semaphore] = None,
     ):
-        """Initialize the game with all dependencies and a starting page."""
+        """
+        Initialize the game with all dependencies and a starting page.
+
+        `request_limiter` is an optional semaphore shared between games to cap how many model
+        requests are in flight at once across all of them.
+        """
         self.config = config
         self.wiki_service = wiki_service
         self.language_model = language_model
         self.tools = tools
         self.event_bus = event_bus
+        self.request_limiter = request_limiter
+
+        # Resolve each tool's implementation and required params once; per-turn validation
+        # is then a dict lookup plus a set difference.
+        self._tool_index = {}
+        for t in self.tools:
+            tool_info = get_tool_by_name(t["name"])
+            input_schema = tool_info.get("schema", {}).get("inputSchema", {})
+            self._tool_index[t["name"]] = ToolEntry(
+                tool_info["implementation"],
+                frozenset(input_schema.get("required", [])),
+            )
+        self._tool_names_csv = ", ".join(self._tool_index)
+
+        # Context index where each completed move's turn began, for windowing the prompt
+        self._turn_starts: List[int] = []
+        # Approximate token count of each completed move except the latest, filled lazily
+        self._turn_tokens: List[int] = []
+        # Running lengths of the "Previous moves" summary; see `_summary_tokens`
+        self._summary_chars: List[int] = [len("Previous moves: ") - len(", ")]
+        # Mirror of `state.context` that the model is prompted with. It is index-aligned with
+        # `state.context` but has the link listings of pages already left collapsed.
+        self._prompt_context: List[ContextMessage] = []
 
         self.id = self._generate_game_id()
 
@@ -58,51 +123,130 @@ class Game:
         self._initialize_context()
 
         logger.info(
-            f"Game {self.id} initialized. Start: '{config.start_page_title}', Target: '{config.target_page_title}'"
+            "Game %s initialized. Start: '%s', Target: '%s'",
+            self.id, config.start_page_title, config.target_page_title,
         )
-        logger.info(f"Player: {self.language_model.config.id}")
-        logger.info(f"Loaded {len(self.tools)} tools.")
+        logger.info("Player: %s", self.language_model.config.id)
+        logger.info("Loaded %d tools.", len(self.tools))
 
     def _generate_game_id(self) -> str:
         """Generate descriptive game ID with model info."""
-        timestamp = datetime.now()
-        date_str = timestamp.strftime("%Y%m%d_%H%M%S")
-        uuid_short = uuid.uuid4().hex[:4]
         model_id = self.language_model.config.id.replace('/', '_')
         # TODO(hunter): open router ids have `/` and `:` in them. \
         # we have to replace `/` since it is in the websocket url 
         # do we also need to replace `:`? 
-        return f"{model_id}_{date_str}_{uuid_short}"
+        # A nanosecond timestamp plus a process-wide counter is unique within a process and
+        # far cheaper than strftime + uuid4 when many games are created at once.
+        return f"{model_id}_{time.time_ns()}_{next(_game_id_counter):04x}"
 
     def _initialize_context(self):
         """Sets up the initial system and user messages in the context."""
         # System Prompt
-        system_prompt = self.state.config.system_prompt_template.format(
-            start_page_title=self.state.config.start_page_title,
-            target_page_title=self.state.config.target_page_title,
-        )
-        self.state.context.append(SystemMessage(content=system_prompt))
+        self._append_context(_system_message(
+            self.state.config.system_prompt_template,
+            self.state.config.start_page_title,
+            self.state.config.target_page_title,
+        ))
 
         # Initial User Message (contains the first page's content)
         initial_user_message = (
             f"You are currently on the page '{self.state.current_page.title}'.\n"
-            f"Here are the available links:\n{self.state.current_page.links}"
+            f"Here are the available links:\n{self.state.current_page.links_block}"
+        )
+        self._append_context(UserMessage.model_construct(content=initial_user_message))
+        self._links_msg_index = len(self.state.context) - 1
+
+    def _append_context(self, message: ContextMessage) -> None:
+        """Append a message to both the game log and the prompt context."""
+        self.state.context.append(message)
+        self._prompt_context.append(message)
+
+    def _model_context(self) -> List[ContextMessage]:
+        """Context to send to the model: the system prompt plus the most recent moves.
+
+        At most `max_context_turns` completed moves are kept, and fewer if needed to stay within
+        `max_context_tokens`. Older moves are replaced by a one-line summary. This is built from
+        `_prompt_context`; `state.context` itself is left intact so the full log is still persisted.
+        """
+        context = self._prompt_context
+        completed = len(self._turn_starts)
+        max_turns = self.config.max_context_turns
+        keep = completed if max_turns is None else min(max_turns, completed)
+        if self.config.max_context_tokens is not None:
+            keep = self._turns_within_token_budget(keep)
+        if keep == completed:
+            return context
+
+        # Windows always start at a turn boundary so tool results stay paired with their calls
+        window_start = self._turn_starts[-keep] if keep else self._links_msg_index
+        summarized_moves = self.state.moves[:completed - keep]
+        summary = "Previous moves: " + ", ".join(
+            f"{m.from_page_title} -> {m.to_page_title}" for m in summarized_moves
         )
-        self.state.context.append(UserMessage(content=initial_user_message))
+        return [context[0], UserMessage.model_construct(content=summary), *context[window_start:]]
+
+    def _turns_within_token_budget(self, max_turns: int) -> int:
+        """How many of the last `max_turns` completed moves fit in `max_context_tokens`."""
+        context = self._prompt_context
+        turn_starts = self._turn_starts
+        completed = len(turn_starts)
+        # A move's messages only change until the next move completes (its page dump is
+        # collapsed then), so every move but the latest is sized once and remembered.
+        while len(self._turn_tokens) < completed - 1:
+            i = len(self._turn_tokens)
+            self._turn_tokens.append(sum(_approx_tokens(m) for m in context[turn_starts[i]:turn_starts[i + 1]]))
+
+        # The system prompt and the turn in progress (current page and any retries) are always sent
+        used = _approx_tokens(context[0]) + sum(_approx_tokens(m) for m in context[self._links_msg_index:])
+        kept = 0
+        for i in range(completed - 1, completed - 1 - max_turns, -1):
+            if i == completed - 1:
+                used += sum(_approx_tokens(m) for m in context[turn_starts[i]:self._links_msg_index])
+            else:
+                used += self._turn_tokens[i]
+            # Moves before the window are sent as a summary line, or as the first page's note
+            # when every move is kept
+            if i:
+                head = self._summary_tokens(i)
+            else:
+                head = sum(_approx_tokens(m) for m in context[1:turn_starts[0]])
+            if used + head > self.config.max_context_tokens:
+                break
+            kept += 1
+        return kept
+
+    def _summary_tokens(self, summarized: int) -> int:
+        """Approximate token count of the "Previous moves" line for the first `summarized` moves."""
+        # _summary_chars[i] is the length of the summary of the first i moves (for i >= 1),
+        # extended as moves are made: each adds "from -> to" plus a ", " separator.
+        chars = self._summary_chars
+        moves = self.state.moves
+        while len(chars) <= summarized:
+            move = moves[len(chars) - 1]
+            chars.append(chars[-1] + len(move.from_page_title) + len(move.to_page_title) + 6)
+        return chars[summarized] // 4
 
     async def run(self):
         """Run the game until completion."""
 
         if self.state.status == GameStatus.NOT_STARTED:
             self.state.status = GameStatus.IN_PROGRESS
-            logger.info(f"Game {self.id} started.")
+            logger.info("Game %s started.", self.id)
+            # A game can wait a while for a slot before run() is called, so tell watchers
+            # when it actually starts
+            if self.event_bus:
+                self.event_bus.publish_nowait(GameEvent(
+                    type="game_started",
+                    game_id=self.id,
+                    data={"game_state": GameStateView.from_state(self.state)}
+                ))
 
         while self.state.status == GameStatus.IN_PROGRESS:
             # Small delay between moves to avoid overwhelming services and to allow for observation.
             # await asyncio.sleep(1.0)
             await self._play_turn()
 
-        logger.info(f"Game {self.id} completed with status: {self.state.status.value}")
+        logger.info("Game %s completed with status: %s", self.id, self.state.status.value)
 
     async def _play_turn(self) -> None:
         """Play a single turn of the game following a retry loop for recoverable errors."""
@@ -111,7 +255,7 @@ class Game:
             return
         
         if self.state.status != GameStatus.IN_PROGRESS:
-            logger.warning(f"_play_turn called but game status is {self.state.status.value}. Game is already considered over.")
+            logger.warning("_play_turn called but game status is %s. Game is already considered over.", self.state.status.value)
             return
 
         current_step = self.state.steps + 1
@@ -119,70 +263,62 @@ class Game:
         
         MAX_ATTEMPTS = 2 # 1 retry. attempts cost me money but we want to allow for correction of a mistake
         last_error = None
+        turn_start = len(self.state.context)
 
         try:
             for attempt in range(MAX_ATTEMPTS):
                 # 1. Get model response
                 try:
-                    assistant_message = await self.language_model.generate_response(
-                        tools=self.tools,
-                            context=self.state.context,
+                    async with self.request_limiter or _NO_REQUEST_LIMIT:
+                        assistant_message = await self.language_model.generate_response(
+                            tools=self.tools,
+                            context=self._model_context(),
                             game_state=self.state,
                         )
-                    self.state.context.append(assistant_message)
+                    self._append_context(assistant_message)
                 except LLMProviderError as e:
-                    logger.error(f"Attempt {attempt + 1}: Model provider error: {e}", exc_info=True)
+                    # Provider errors are expected failures; only pay for the traceback when debugging
+                    logger.error(
+                        "Attempt %d: Model provider error: %s", attempt + 1, e,
+                        exc_info=logger.isEnabledFor(logging.DEBUG),
+                    )
                     last_error = GameError(type=ErrorType.PROVIDER_API_ERROR, message=str(e))
                     self.state.status = GameStatus.ERROR
                     break # end game on api errors
 
                 # 2. Check for tool calls
                 if not assistant_message.tool_calls:
-                    logger.warning(f"Attempt {attempt + 1}: Model did not call a tool.")
-                    self.state.context.append(
-                        UserMessage(content="You must use a tool to navigate. Please choose one of the available tools.")
+                    logger.warning("Attempt %d: Model did not call a tool.", attempt + 1)
+                    self._append_context(
+                        UserMessage.model_construct(content="You must use a tool to navigate. Please choose one of the available tools.")
                     )
-                    last_error = GameError(type=ErrorType.MODEL_NO_TOOL_CALL, message="Model did not call a tool.")
+                    last_error = _ERR_NO_TOOL_CALL
                     continue
 
                 # For this game, we only handle the first tool call
                 tool_call = assistant_message.tool_calls[0]
 
                 # 3. Validate tool name
-                try:
-                    tool_info = get_tool_by_name(tool_call.name)
-                    tool_implementation = tool_info["implementation"]
-                except ValueError as e:
-                    logger.warning(f"Attempt {attempt + 1}: Model called an invalid tool '{tool_call.name}'.")
-                    error_message = f"Error: {str(e)}. You must use one of the available tools."
-                    self.state.context.append(
-                        ToolResultMessage(
-                            tool_call_id=tool_call.id,
-                            content=error_message,
-                            is_error=True
-                        )
+                tool_entry = self._tool_index.get(tool_call.name)
+                if tool_entry is None:
+                    logger.warning("Attempt %d: Model called an invalid tool '%s'.", attempt + 1, tool_call.name)
+                    not_found_message = f"Tool '{tool_call.name}' not found"
+                    error_message = (
+                        f"Error: {not_found_message}. Available: {self._tool_names_csv}. "
+                        "You must use one of the available tools."
                     )
-                    last_error = GameError(type=ErrorType.MODEL_INVALID_TOOL, message=str(e))
+                    self._append_context(_tool_error(tool_call.id, error_message))
+                    last_error = GameError.model_construct(type=ErrorType.MODEL_INVALID_TOOL, message=not_found_message)
                     continue
 
                 # 4. Validate tool call argument schema
-                tool_schema = tool_info.get("schema", {})
-                input_schema = tool_schema.get("inputSchema", {})
-                required_params = input_schema.get("required", [])
                 provided_args = tool_call.arguments or {}
-
-                missing_params = [p for p in required_params if p not in provided_args]
+                missing_params = sorted(tool_entry.required - provided_args.keys())
                 if missing_params:
                     error_message = f"Error: Missing required arguments for tool '{tool_call.name}'. Missing: {', '.join(missing_params)}"
-                    logger.warning(f"Attempt {attempt + 1}: {error_message}")
-                    self.state.context.append(
-                        ToolResultMessage(
-                            tool_call_id=tool_call.id,
-                            content=error_message,
-                            is_error=True
-                        )
-                    )
-                    last_error = GameError(
+                    logger.warning("Attempt %d: %s", attempt + 1, error_message)
+                    self._append_context(_tool_error(tool_call.id, error_message))
+                    last_error = GameError.model_construct(
                         type=ErrorType.MODEL_INVALID_TOOL,
                         message="Missing required arguments for tool call.",
                         metadata={"missing_params": missing_params}
@@ -191,18 +327,12 @@ class Game:
 
                 to_page_title = tool_call.arguments["to_page_title"]
                 # 5. Validate link is on the current page
-                if to_page_title not in self.state.current_page.links:
-                    is_target_page = to_page_title == self.state.config.target_page_title
-                    logger.warning(f"Attempt {attempt + 1}: Model chose a link '{to_page_title}' that is not on the current page.")
+                if to_page_title not in self.state.current_page.link_set:
+                    is_target_page = to_page_title == self.config.target_page_title
+                    logger.warning("Attempt %d: Model chose a link '%s' that is not on the current page.", attempt + 1, to_page_title)
                     error_message = f"Error: Page '{to_page_title}' is not in available links of '{self.state.current_page.title}'"
-                    self.state.context.append(
-                        ToolResultMessage(
-                            tool_call_id=tool_call.id,
-                            content=error_message,
-                            is_error=True
-                        )
-                    )
-                    last_error = GameError(
+                    self._append_context(_tool_error(tool_call.id, error_message))
+                    last_error = GameError.model_construct(
                         type=ErrorType.MODEL_INVALID_LINK,
                         message=error_message,
                         metadata={
@@ -217,30 +347,25 @@ class Game:
                 # 6. Execute tool and handle results
                 try:
                     # TODO(hunter): passing the wiki_service feels wrong here. guess we go back to mcp client
-                    next_page = await tool_implementation(wiki_service=self.wiki_service, **tool_call.arguments)
+                    next_page = await tool_entry.impl(wiki_service=self.wiki_service, **tool_call.arguments)
                     # TODO(hunter): model needs to know if the link redirected so they don't get confused
                     tool_result_message = (
                         f"Successfully navigated to '{next_page.title}'. "
                         f"It has {len(next_page.links)} links."
                     )
-                    self.state.context.append(
-                        ToolResultMessage(tool_call_id=tool_call.id, content=tool_result_message, is_error=False)
+                    self._append_context(
+                        ToolResultMessage.model_construct(tool_call_id=tool_call.id, content=tool_result_message, is_error=False)
                     )
                     
+                    self._turn_starts.append(turn_start)
                     await self._handle_successful_move(current_step, current_page_title, next_page)
                     return  # Success, exit the turn
 
                 except (ConnectionError, ValueError) as e:
                     # Handle tool execution errors (e.g., page not found)
-                    logger.warning(f"Attempt {attempt + 1}: Tool '{tool_call.name}' failed. Error: {e}")
-                    self.state.context.append(
-                        ToolResultMessage(
-                            tool_call_id=tool_call.id,
-                            content=f"Error executing tool: {e}",
-                            is_error=True
-                        )
-                    )
-                    last_error = GameError(type=ErrorType.APP_NAVIGATION_ERROR, message=f"Navigation failed: {e}")
+                    logger.warning("Attempt %d: Tool '%s' failed. Error: %s", attempt + 1, tool_call.name, e)
+                    self._append_context(_tool_error(tool_call.id, f"Error executing tool: {e}"))
+                    last_error = GameError.model_construct(type=ErrorType.APP_NAVIGATION_ERROR, message=f"Navigation failed: {e}")
                     continue
                 except Exception as e:
                     last_error = GameError(
@@ -251,19 +376,19 @@ class Game:
                     break # end game on unexpected errors
 
             # If the loop finishes, all attempts have failed.
-            logger.error(f"Game lost after {MAX_ATTEMPTS} failed attempts to make a move.")
+            logger.error("Game lost after %d failed attempts to make a move.", MAX_ATTEMPTS)
             self.state.error_message = last_error.message
             if self.state.status != GameStatus.ERROR:
                 self.state.status = GameStatus.LOST_INVALID_MOVE
-            await self._emit_game_ended_event()
+            self._emit_game_ended_event()
         
         # TODO(hunter): should we be raising some errors within this?
         # should this emit a special event? 
         except Exception as e:
-            logger.error(f"Game {self.id} Step {current_step}: Unexpected error: {e}", exc_info=True)
+            logger.error("Game %s Step %d: Unexpected error: %s", self.id, current_step, e, exc_info=True)
             self.state.status = GameStatus.ERROR
             self.state.error_message = f"Unexpected error: {e}"
-            await self._emit_game_ended_event()
+            self._emit_game_ended_event()
     
     async def _handle_successful_move(self, step: int, from_page: str, new_page: Page) -> None:
         """Handle a successful move and update game state."""
@@ -271,7 +396,7 @@ class Game:
         self.state.current_page = new_page
 
         # Create successful move record
-        move = Move(
+        move = Move.model_construct(
             step=step,
             from_page_title=from_page,
             to_page_title=new_page.title,
@@ -281,49 +406,59 @@ class Game:
         self.state.moves.append(move)
         self.state.steps += 1
 
-        logger.info(f"Game {self.id} Step {step}: '{from_page}' -> '{new_page.title}'")
+        logger.info("Game %s Step %d: '%s' -> '%s'", self.id, step, from_page, new_page.title)
 
         # Check win condition
         game_over = False
-        if new_page.title == self.state.config.target_page_title:
+        if new_page.title == self.config.target_page_title:
             self.state.status = GameStatus.WON
             self.state.error_message = f"Reached the target page '{new_page.title}' in {self.state.steps} steps."
-            logger.info(f"Game {self.id}: Won! Reached target '{new_page.title}' in {self.state.steps} steps.")
+            logger.info("Game %s: Won! Reached target '%s' in %d steps.", self.id, new_page.title, self.state.steps)
             game_over = True
         # Check max steps
-        elif self.state.steps >= self.state.config.max_steps:
+        elif self.state.steps >= self.config.max_steps:
             self.state.status = GameStatus.LOST_MAX_STEPS
             self.state.error_message = "Maximum turns reached"
-            logger.info(f"Game {self.id}: Lost - Max turns ({self.state.config.max_steps}) reached.")
+            logger.info("Game %s: Lost - Max turns (%d) reached.", self.id, self.config.max_steps)
             game_over = True
 
         # Provide the context for the next turn if the game is still in progress
         if not game_over:
+            # Only the current page's links are actionable, so collapse the previous link dump
+            # to a one-line note. This keeps the prompt O(links) rather than O(steps * links).
+            # Only the prompt copy is collapsed; `state.context` keeps the full listing for the log.
+            self._prompt_context[self._links_msg_index] = UserMessage.model_construct(
+                content=f"You were on the page '{from_page}'."
+            )
             new_user_message = (
                 f"You are now on the page '{self.state.current_page.title}'.\n"
-                f"Here are the available links:\n{self.state.current_page.links}"
+                f"Here are the available links:\n{self.state.current_page.links_block}"
             )
-            self.state.context.append(UserMessage(content=new_user_message))
+            self._append_context(UserMessage.model_construct(content=new_user_message))
+            self._links_msg_index = len(self.state.context) - 1
 
         # Emit event if event bus is available
+        # Events are queued for background delivery so slow subscribers (websockets, storage)
+        # never delay the next turn; the bus delivers them in order.
         if self.event_bus:
-            await self.event_bus.publish(GameEvent(
+            self.event_bus.publish_nowait(GameEvent(
                 type="move_completed",
                 game_id=self.id,
                 data={
                     # TODO(hunter): think about this event
                     "move": move, # frontend only uses move
-                    "game_state": self.state, # solver only uses game_state
+                    # snapshot, not the live state: delivery is async and the game moves on
+                    "game_state": GameStateView.from_state(self.state), # solver only uses game_state
                 }
             ))
 
             if game_over:
-                await self._emit_game_ended_event()
+                self._emit_game_ended_event()
 
-    async def _emit_game_ended_event(self):
+    def _emit_game_ended_event(self):
         """Helper method to emit game_ended event."""
         if self.event_bus:
-            await self.event_bus.publish(GameEvent(
+            self.event_bus.publish_nowait(GameEvent(
                 type="game_ended",
                 game_id=self.id,
                 data={
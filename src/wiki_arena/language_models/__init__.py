@@ -1,6 +1,8 @@
 # Simplified language model creation
+import copy
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Type, Any, Optional
 from .language_model import (
@@ -21,8 +23,14 @@ PROVIDERS: Dict[str, Type[LanguageModel]] = {
     "random": RandomModel
 }
 
+@lru_cache(maxsize=1)
 def _load_models_config() -> Dict[str, Any]:
-    """Load models configuration from models.json file."""
+    """
+    Load models configuration from models.json file.
+
+    The file is read once per process and the parsed dict is shared, so callers must not
+    mutate it. Use `_load_models_config.cache_clear()` to force a reload.
+    """
     # Try current directory first, then project root
     possible_paths = [
         Path("models.json"),
@@ -85,7 +93,7 @@ def create_model(model_key: str, **overrides) -> LanguageModel:
 
 def list_available_models() -> Dict[str, Dict[str, Any]]:
     """List all available models from models.json."""
-    return _load_models_config()
+    return copy.deepcopy(_load_models_config())
 
 def get_model_info(model_key: str) -> Dict[str, Any]:
     """Get display information for a specific model."""
@@ -102,7 +110,7 @@ def get_model_info(model_key: str) -> Dict[str, Any]:
         "description": model_def.get("description", "No description"),
         "input_cost": f"${model_def['input_cost_per_1m_tokens']}/1M tokens",
         "output_cost": f"${model_def['output_cost_per_1m_tokens']}/1M tokens",
-        "default_settings": model_def["default_settings"]
+        "default_settings": model_def["default_settings"].copy()
     }
 
 __all__ = [
@@ -1,10 +1,12 @@
 import json
 import logging
+import time
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from anthropic import (
-    Anthropic,
+    AsyncAnthropic,
     AnthropicError,
     RateLimitError,
     APITimeoutError,
@@ -25,22 +27,56 @@ from .language_model import (
     LLMRateLimitError,
     LLMTimeoutError,
 )
+from .response_cache import ResponseCache
 
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _shared_client() -> AsyncAnthropic:
+    """
+    Create the process-wide Anthropic client.
+
+    Every AnthropicModel shares it, so concurrent games reuse one pool of warm connections
+    instead of each paying for its own TCP/TLS handshakes.
+    """
+    return AsyncAnthropic()  # API key is inferred from ANTHROPIC_API_KEY env var
+
+
 class AnthropicModel(LanguageModel):
     """
     LanguageModel implementation for Anthropic's Claude models.
     """
     DEFAULT_MAX_TOKENS = 1024
+    # Prompt cache writes are billed at a multiple of the base input price that depends on the
+    # cache lifetime. Cache reads are 0.1 times the base input price.
+    CACHE_WRITE_MULTIPLIERS = {"5m": 1.25, "1h": 2.0}
+    CACHE_READ_MULTIPLIER = 0.1
 
     def __init__(self, config: ModelConfig):
         super().__init__(config=config)
-        self.client = Anthropic()  # API key is inferred from ANTHROPIC_API_KEY env var
+        # Async client so a pending request doesn't block the event loop other games run on.
+        self.client = _shared_client()
         self.model_name = self.config.model_name
         self.max_tokens = self.config.settings.get("max_tokens", self.DEFAULT_MAX_TOKENS)
+        self.temperature = self.config.settings.get("temperature")
+        self._response_cache = ResponseCache.from_settings(self.config.settings)
+
+        cache_ttl = self.config.settings.get("cache_ttl", "5m")
+        if cache_ttl not in self.CACHE_WRITE_MULTIPLIERS:
+            raise ValueError(f"Unsupported cache_ttl '{cache_ttl}'. Use one of: {list(self.CACHE_WRITE_MULTIPLIERS)}")
+        self._cache_control = {"type": "ephemeral"}
+        if cache_ttl != "5m":
+            self._cache_control["ttl"] = cache_ttl
+
+        # Per-token rates, fixed for the life of the model
+        self._input_rate = self._output_rate = self._cache_write_rate = self._cache_read_rate = 0.0
+        if self.config.input_cost_per_1m_tokens and self.config.output_cost_per_1m_tokens:
+            self._input_rate = self.config.input_cost_per_1m_tokens / 1_000_000
+            self._output_rate = self.config.output_cost_per_1m_tokens / 1_000_000
+            self._cache_write_rate = self._input_rate * self.CACHE_WRITE_MULTIPLIERS[cache_ttl]
+            self._cache_read_rate = self._input_rate * self.CACHE_READ_MULTIPLIER
 
     def _calculate_cost(
         self,
@@ -50,20 +86,12 @@ class AnthropicModel(LanguageModel):
         cache_read_tokens: int = 0,
     ) -> float:
         """Calculate cost based on Anthropic's pricing and token usage, including caching."""
-        if not self.config.input_cost_per_1m_tokens or not self.config.output_cost_per_1m_tokens:
-            return 0.0
-
-        # Regular input and output tokens are priced at standard rates
-        input_cost = (prompt_tokens / 1_000_000) * self.config.input_cost_per_1m_tokens
-        output_cost = (completion_tokens / 1_000_000) * self.config.output_cost_per_1m_tokens
-
-        # Cache token costs
-        # 5-minute cache write tokens are 1.25 times the base input tokens price
-        cache_creation_cost = (cache_creation_tokens / 1_000_000) * self.config.input_cost_per_1m_tokens * 1.25
-        # Cache read tokens are 0.1 times the base input tokens price
-        cache_read_cost = (cache_read_tokens / 1_000_000) * self.config.input_cost_per_1m_tokens * 0.1
-
-        return input_cost + output_cost + cache_creation_cost + cache_read_cost
+        return (
+            prompt_tokens * self._input_rate
+            + completion_tokens * self._output_rate
+            + cache_creation_tokens * self._cache_write_rate
+            + cache_read_tokens * self._cache_read_rate
+        )
 
     def _format_tools(self, mcp_tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Convert MCP tool definitions to Anthropic tool format."""
@@ -82,32 +110,35 @@ class AnthropicModel(LanguageModel):
         messages: List[Dict[str, Any]] = []
         
         # Extract the system prompt first.
+        turns = iter(context)
         if context and context[0].role == "system":
             system_prompt_blocks = [{"type": "text", "text": context[0].content}]
             # Add cache control to the system prompt's content block.
-            system_prompt_blocks[0]["cache_control"] = {"type": "ephemeral"}
-            context = context[1:]
-
-        for turn in context:
-            if isinstance(turn, (UserMessage, ToolResultMessage)):
-                # Anthropic uses 'user' role for both user and tool result messages. 
-                # For simplicity here, we assume a back-and-forth conversation.
-                if isinstance(turn, ToolResultMessage):
-                    messages.append({
-                        "role": "user",
-                        "content": [{
-                            "type": "tool_result",
-                            "tool_use_id": turn.tool_call_id,
-                            "content": turn.content,
-                            "is_error": turn.is_error,
-                        }]
-                    })
-                else: # UserMessage
-                    content = turn.content
-                    if not isinstance(content, list):
-                        content = [{"type": "text", "text": content}]
-                    messages.append({"role": "user", "content": content})
+            system_prompt_blocks[0]["cache_control"] = self._cache_control
+            # Skip past it without slicing, which would copy the whole context every turn.
+            next(turns)
+
+        # Last content block before the newest user message. The game rewrites its previous
+        # page dump once the model moves on, so only the history up to here is guaranteed to
+        # be identical on the next turn.
+        stable_block: Optional[Dict[str, Any]] = None
+        for turn in turns:
+            if isinstance(turn, ToolResultMessage):
+                role = "user"
+                content = [{
+                    "type": "tool_result",
+                    "tool_use_id": turn.tool_call_id,
+                    "content": turn.content,
+                    "is_error": turn.is_error,
+                }]
+            elif isinstance(turn, UserMessage):
+                role = "user"
+                if messages and messages[-1]["content"]:
+                    stable_block = messages[-1]["content"][-1]
+                content = turn.content
+                content = list(content) if isinstance(content, list) else [{"type": "text", "text": content}]
             elif isinstance(turn, AssistantMessage):
+                role = "assistant"
                 content = []
                 if turn.content:
                     content.append({"type": "text", "text": turn.content})
@@ -119,16 +150,41 @@ class AnthropicModel(LanguageModel):
                             "name": tool_call.name,
                             "input": tool_call.arguments,
                         })
-                messages.append({"role": "assistant", "content": content})
-        
-        # Add cache control to the last content block of the last message
-        if messages:
-            last_message_content = messages[-1]["content"]
-            if last_message_content:
-                last_message_content[-1]["cache_control"] = {"type": "ephemeral"}
+            else:
+                continue
+
+            # Anthropic requires user/assistant alternation, so consecutive same-role turns
+            # (a tool result followed by the next page's user message) share one message.
+            if messages and messages[-1]["role"] == role:
+                messages[-1]["content"].extend(content)
+            else:
+                messages.append({"role": role, "content": content})
+
+        # Add cache control to the last content block of the last message (reused by a retry)
+        last_block = messages[-1]["content"][-1] if messages and messages[-1]["content"] else None
+        if last_block is not None:
+            last_block["cache_control"] = self._cache_control
+
+        # Cache the stable history so the next turn reads it instead of paying for it again
+        if stable_block is not None and stable_block is not last_block:
+            stable_block["cache_control"] = self._cache_control
 
         return system_prompt_blocks, messages
 
+    def _build_request(self, tools: List[Dict[str, Any]], context: List[ContextMessage]) -> Dict[str, Any]:
+        """Build the `messages.create` kwargs; also used as the response cache key."""
+        system_prompt_blocks, messages = self._format_context(context)
+        request = {
+            "model": self.model_name,
+            "max_tokens": self.max_tokens,
+            "system": system_prompt_blocks,
+            "messages": messages,
+            "tools": self._get_formatted_tools(tools),
+        }
+        if self.temperature is not None:
+            request["temperature"] = self.temperature
+        return request
+
     async def generate_response(
         self,
         tools: List[Dict[str, Any]],
@@ -136,21 +192,25 @@ class AnthropicModel(LanguageModel):
         game_state: GameState,
     ) -> AssistantMessage:
         
-        system_prompt_blocks, messages = self._format_context(context)
-        formatted_tools = self._format_tools(tools)
+        request = self._build_request(tools, context)
         
-        logger.debug(f"Sending request to Anthropic with system prompt: {system_prompt_blocks}")
-        logger.debug(f"Sending request to Anthropic with messages: {json.dumps(messages, indent=2)}")
+        # The message dump grows with the whole context, so only build it when it will be logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sending request to Anthropic with system prompt: %s", request["system"])
+            logger.debug("Sending request to Anthropic with messages: %s", json.dumps(request["messages"], indent=2))
+
+        cache_key = None
+        if self._response_cache is not None:
+            cache_key = ResponseCache.make_key([self.model_name, request])
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Response served from cache")
+                return cached
 
         try:
             start_time = datetime.now()
-            response = self.client.messages.create(
-                model=self.model_name,
-                max_tokens=self.max_tokens,
-                system=system_prompt_blocks,
-                messages=messages,
-                tools=formatted_tools,
-            )
+            start_perf = time.perf_counter()
+            response = await self.client.messages.create(**request)
             
             # Calculate metrics for logging
             usage = response.usage
@@ -161,23 +221,36 @@ class AnthropicModel(LanguageModel):
 
             total_tokens = input_tokens + output_tokens
             cost = self._calculate_cost(input_tokens, output_tokens, cache_creation_tokens, cache_read_tokens)
-            duration_ms = (datetime.now() - start_time).total_seconds() * 1000
-
-            log_parts = [
-                f"Input: {input_tokens}",
-                f"Output: {output_tokens}",
-            ]
-            if cache_creation_tokens > 0:
-                log_parts.append(f"Cache Creation: {cache_creation_tokens}")
-            if cache_read_tokens > 0:
-                log_parts.append(f"Cache Read: {cache_read_tokens}")
-            
-            log_parts.extend([
-                f"Total: {total_tokens}",
-                f"Cost: ${cost:.4f}",
-                f"Duration: {duration_ms:.1f}ms"
-            ])
-            logger.info(f"Response Tokens: {' | '.join(log_parts)}")
+            duration_ms = (time.perf_counter() - start_perf) * 1000
+
+            # Skip building the summary when INFO is filtered out (e.g. quiet batch runs). The
+            # fields are also attached to the record for handlers that emit structured logs.
+            if logger.isEnabledFor(logging.INFO):
+                log_parts = [
+                    f"Input: {input_tokens}",
+                    f"Output: {output_tokens}",
+                ]
+                if cache_creation_tokens > 0:
+                    log_parts.append(f"Cache Creation: {cache_creation_tokens}")
+                if cache_read_tokens > 0:
+                    log_parts.append(f"Cache Read: {cache_read_tokens}")
+
+                log_parts.extend([
+                    f"Total: {total_tokens}",
+                    f"Cost: ${cost:.4f}",
+                    f"Duration: {duration_ms:.1f}ms"
+                ])
+                logger.info(
+                    "Response Tokens: %s", " | ".join(log_parts),
+                    extra={
+                        "input_tokens": input_tokens,
+                        "output_tokens": output_tokens,
+                        "cache_creation_input_tokens": cache_creation_tokens,
+                        "cache_read_input_tokens": cache_read_tokens,
+                        "cost_usd": cost,
+                        "duration_ms": duration_ms,
+                    },
+                )
 
             metrics = ModelCallMetrics(
                 input_tokens=input_tokens,
@@ -190,12 +263,12 @@ class AnthropicModel(LanguageModel):
                 request_timestamp=start_time
             )
 
-            model_text_response = None
+            text_parts: List[str] = []
             tool_calls = []
             
             for content_block in response.content:
                 if content_block.type == "text":
-                    model_text_response = (model_text_response or "") + content_block.text
+                    text_parts.append(content_block.text)
                 elif content_block.type == "tool_use":
                     tool_calls.append(
                         AssistantToolCall(
@@ -205,18 +278,23 @@ class AnthropicModel(LanguageModel):
                         )
                     )
 
-            return AssistantMessage(
-                content=model_text_response,
+            assistant_message = AssistantMessage(
+                content="".join(text_parts) if text_parts else None,
                 tool_calls=tool_calls if tool_calls else None,
                 metrics=metrics
             )
+            if cache_key is not None:
+                self._response_cache.put(cache_key, assistant_message)
+            return assistant_message
             
+        # These errors are re-raised and reported by the game, so the traceback is only worth
+        # formatting when debugging.
         except RateLimitError as e:
-            logger.error(f"Anthropic API rate limit exceeded: {e}", exc_info=True)
+            logger.error("Anthropic API rate limit exceeded: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             raise LLMRateLimitError from e
         except APITimeoutError as e:
-            logger.error(f"Anthropic API call timed out: {e}", exc_info=True)
+            logger.error("Anthropic API call timed out: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             raise LLMTimeoutError from e
         except AnthropicError as e:
-            logger.error(f"Anthropic API call failed: {e}", exc_info=True)
+            logger.error("Anthropic API call failed: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             raise LLMProviderError from e
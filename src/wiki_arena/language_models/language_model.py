@@ -35,6 +35,9 @@ class LanguageModel(ABC):
             config: A Pydantic model containing provider, model name, pricing, and settings.
         """
         self.config = config
+        # Provider-format tools for the last tools list seen; see `_get_formatted_tools`
+        self._formatted_tools_source: Optional[List[Dict[str, Any]]] = None
+        self._formatted_tools: Any = None
         super().__init__()
 
     @abstractmethod
@@ -64,6 +67,17 @@ class LanguageModel(ABC):
         """
         pass
 
+    def _get_formatted_tools(self, tools: List[Dict[str, Any]]) -> Any:
+        """
+        Return `tools` in the provider's format, reusing the previous result for the same list.
+
+        A game passes the same tools list on every turn, so it only needs formatting once.
+        """
+        if tools is not self._formatted_tools_source:
+            self._formatted_tools = self._format_tools(tools)
+            self._formatted_tools_source = tools
+        return self._formatted_tools
+
     @abstractmethod
     def _format_context(self, context: List[ContextMessage]) -> Any:
         """
@@ -1,10 +1,13 @@
+import hashlib
 import json
 import logging
+import time
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List
 
 from openai import (
-    OpenAI,
+    AsyncOpenAI,
     OpenAIError,
     APIConnectionError,
     APITimeoutError,
@@ -16,6 +19,7 @@ from .language_model import (
     LLMRateLimitError,
     LLMTimeoutError,
 )
+from .response_cache import ResponseCache
 from wiki_arena.types import (
     AssistantMessage,
     AssistantToolCall,
@@ -23,14 +27,44 @@ from wiki_arena.types import (
     ModelCallMetrics,
     ModelConfig,
     GameState,
+    ToolResultMessage,
 )
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=1)
+def _shared_client() -> AsyncOpenAI:
+    """
+    Create the process-wide OpenAI client.
+
+    Every OpenAIModel shares it, so concurrent games reuse one pool of warm connections
+    instead of each paying for its own TCP/TLS handshakes.
+    """
+    return AsyncOpenAI() # Assumes OPENAI_API_KEY is set in environment
+
+
+@lru_cache(maxsize=256)
+def _prompt_cache_key(system_prompt: str) -> str:
+    """
+    Routing key for OpenAI's automatic prompt caching.
+
+    Requests that share a key go to the same cache-warm servers. Every game on a task
+    starts with the same system prompt, so keying on it groups the requests whose
+    prefixes can actually be reused.
+    """
+    return hashlib.blake2b(system_prompt.encode(), digest_size=16).hexdigest()
+
+
 class OpenAIModel(LanguageModel):
+    # Prompt tokens served from OpenAI's automatic prompt cache are billed at a discount
+    CACHE_READ_MULTIPLIER = 0.5
+
     def __init__(self, config: ModelConfig):
         super().__init__(config=config)
-        self.client = OpenAI() # Assumes OPENAI_API_KEY is set in environment
+        # Async client so a pending request doesn't block the event loop other games run on.
+        self.client = _shared_client()
+        self._response_cache = ResponseCache.from_settings(self.config.settings)
 
     def _calculate_cost(
         self,
@@ -39,8 +73,13 @@ class OpenAIModel(LanguageModel):
         cache_creation_tokens: int = 0,
         cache_read_tokens: int = 0,
     ) -> float:
-        """Calculate cost based on OpenAI's pricing and token usage, including caching."""
-        input_cost = (prompt_tokens / 1_000_000) * self.config.input_cost_per_1m_tokens
+        """
+        Calculate cost based on OpenAI's pricing and token usage, including caching.
+
+        `prompt_tokens` are the uncached prompt tokens; cached ones are passed as `cache_read_tokens`.
+        """
+        input_rate = self.config.input_cost_per_1m_tokens / 1_000_000
+        input_cost = prompt_tokens * input_rate + cache_read_tokens * input_rate * self.CACHE_READ_MULTIPLIER
         output_cost = (completion_tokens / 1_000_000) * self.config.output_cost_per_1m_tokens
         return input_cost + output_cost
 
@@ -50,29 +89,48 @@ class OpenAIModel(LanguageModel):
 
     def _format_context(self, context: List[ContextMessage]) -> List[Dict[str, Any]]:
         """Converts the universal conversation history to OpenAI's format."""
-        messages = []
-        for turn in context:
-            message = {"role": turn.role.value, "content": turn.content}
-            # Handle assistant messages with tool calls
-            if isinstance(turn, AssistantMessage) and turn.tool_calls:
-                message["tool_calls"] = [
-                    {
-                        "id": tc.id,
-                        "type": "function",
-                        "function": {"name": tc.name, "arguments": str(tc.arguments)},
-                    }
-                    for tc in turn.tool_calls
-                ]
-            # Handle tool response messages
-            if turn.role == "tool":
-                message = {
-                    "role": "tool",
-                    "tool_call_id": turn.tool_call_id,
-                    "content": turn.content,
+        return [self._format_turn(turn) for turn in context]
+
+    @staticmethod
+    def _format_turn(turn: ContextMessage) -> Dict[str, Any]:
+        """Converts a single context message to an OpenAI chat message."""
+        # Handle tool response messages
+        if isinstance(turn, ToolResultMessage):
+            return {"role": "tool", "tool_call_id": turn.tool_call_id, "content": turn.content}
+        message = {"role": turn.role.value, "content": turn.content}
+        # Handle assistant messages with tool calls
+        if isinstance(turn, AssistantMessage) and turn.tool_calls:
+            message["tool_calls"] = [
+                {
+                    "id": tc.id,
+                    "type": "function",
+                    # Arguments go back as compact JSON with a fixed key order, the same bytes every turn
+                    "function": {
+                        "name": tc.name,
+                        "arguments": json.dumps(tc.arguments, sort_keys=True, separators=(",", ":")),
+                    },
                 }
-            messages.append(message)
-        return messages
-
+                for tc in turn.tool_calls
+            ]
+        return message
+
+    def _build_request(self, tools: List[Dict[str, Any]], context: List[ContextMessage]) -> Dict[str, Any]:
+        """Build the `chat.completions.create` kwargs; also used as the response cache key."""
+        # Tools and the system prompt never change within a game, so every turn's request
+        # starts with the same cacheable prefix.
+        request = {
+            "model": self.config.model_name,
+            "messages": self._format_context(context),
+            "tools": self._get_formatted_tools(tools),
+            "tool_choice": "auto",
+            "max_tokens": self.config.settings.get("max_tokens", 1024),
+        }
+        if "temperature" in self.config.settings:
+            request["temperature"] = self.config.settings["temperature"]
+        if context and context[0].role == "system":
+            # Sent through extra_body so older SDK versions without the parameter still work
+            request["extra_body"] = {"prompt_cache_key": _prompt_cache_key(context[0].content)}
+        return request
 
     async def generate_response(
         self,
@@ -81,43 +139,67 @@ class OpenAIModel(LanguageModel):
         game_state: GameState,
     ) -> AssistantMessage:
         
-        formatted_tools = self._format_tools(tools)
-        messages = self._format_context(context)
+        request = self._build_request(tools, context)
+
+        cache_key = None
+        if self._response_cache is not None:
+            cache_key = ResponseCache.make_key([self.config.model_name, request])
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Response served from cache")
+                return cached
 
         try:
-            logger.debug(f"Sending request with messages: {messages}")
+            logger.debug("Sending request with messages: %s", request["messages"])
             start_time = datetime.now()
-            response = self.client.chat.completions.create(
-                model=self.config.model_name,
-                messages=messages,
-                tools=formatted_tools,
-                tool_choice="auto",
-                max_tokens=self.config.settings.get("max_tokens", 1024),
-                # TODO(hunter): cache control
-                # TODO(hunter): timeout
-            )
-            logger.debug(f"API response received: {response}")
+            start_perf = time.perf_counter()
+            # TODO(hunter): cache control
+            # TODO(hunter): timeout
+            response = await self.client.chat.completions.create(**request)
+            logger.debug("API response received: %s", response)
 
             # Calculate metrics for logging
-            input_tokens = response.usage.prompt_tokens
-            output_tokens = response.usage.completion_tokens
-            total_tokens = response.usage.total_tokens
-            cost = self._calculate_cost(input_tokens, output_tokens)
-            duration_ms = (datetime.now() - start_time).total_seconds() * 1000
-
-            log_parts = [
-                f"Input: {input_tokens}",
-                f"Output: {output_tokens}",
-                f"Total: {total_tokens}",
-                f"Cost: ${cost:.4f}",
-                f"Duration: {duration_ms:.1f}ms"
-            ]
-            logger.info(f"Response Tokens: {' | '.join(log_parts)}")
+            usage = response.usage
+            # prompt_tokens includes the cached prefix; split it out so it is billed at the cached rate
+            prompt_details = getattr(usage, "prompt_tokens_details", None)
+            cache_read_tokens = getattr(prompt_details, "cached_tokens", 0) or 0
+            input_tokens = usage.prompt_tokens - cache_read_tokens
+            output_tokens = usage.completion_tokens
+            total_tokens = usage.total_tokens
+            cost = self._calculate_cost(input_tokens, output_tokens, cache_read_tokens=cache_read_tokens)
+            duration_ms = (time.perf_counter() - start_perf) * 1000
+
+            # Skip building the summary when INFO is filtered out (e.g. quiet batch runs). The
+            # fields are also attached to the record for handlers that emit structured logs.
+            if logger.isEnabledFor(logging.INFO):
+                log_parts = [
+                    f"Input: {input_tokens}",
+                    f"Output: {output_tokens}",
+                ]
+                if cache_read_tokens > 0:
+                    cache_hit_ratio = cache_read_tokens / usage.prompt_tokens
+                    log_parts.append(f"Cache Read: {cache_read_tokens} ({cache_hit_ratio:.0%})")
+                log_parts.extend([
+                    f"Total: {total_tokens}",
+                    f"Cost: ${cost:.4f}",
+                    f"Duration: {duration_ms:.1f}ms"
+                ])
+                logger.info(
+                    "Response Tokens: %s", " | ".join(log_parts),
+                    extra={
+                        "input_tokens": input_tokens,
+                        "output_tokens": output_tokens,
+                        "cache_read_input_tokens": cache_read_tokens,
+                        "cost_usd": cost,
+                        "duration_ms": duration_ms,
+                    },
+                )
 
             metrics = ModelCallMetrics(
                 input_tokens=input_tokens,
                 output_tokens=output_tokens,
                 total_tokens=total_tokens,
+                cache_read_input_tokens=cache_read_tokens,
                 estimated_cost_usd=cost,
                 response_time_ms=duration_ms,
                 request_timestamp=start_time,
@@ -147,18 +229,23 @@ class OpenAIModel(LanguageModel):
                             )
                         )
 
-            return AssistantMessage(
+            assistant_message = AssistantMessage(
                 content=model_text_response,
                 tool_calls=tool_calls if tool_calls else None,
                 metrics=metrics
             )
+            if cache_key is not None:
+                self._response_cache.put(cache_key, assistant_message)
+            return assistant_message
 
+        # These errors are re-raised and reported by the game, so the traceback is only worth
+        # formatting when debugging.
         except RateLimitError as e:
-            logger.error(f"OpenAI API rate limit exceeded: {e}", exc_info=True)
+            logger.error("OpenAI API rate limit exceeded: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             raise LLMRateLimitError from e
         except APITimeoutError as e:
-            logger.error(f"OpenAI API call timed out: {e}", exc_info=True)
+            logger.error("OpenAI API call timed out: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             raise LLMTimeoutError from e
         except OpenAIError as e:
-            logger.error(f"Error generating response from OpenAI: {e}", exc_info=True)
+            logger.error("Error generating response from OpenAI: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             raise LLMProviderError from e
\ No newline at end of file
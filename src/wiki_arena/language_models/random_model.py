@@ -1,9 +1,7 @@
 import asyncio
+import itertools
 import random
 import time
-import uuid
-import ast
-import re
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -25,6 +23,14 @@ class RandomModel(LanguageModel):
 
     def __init__(self, config: OpenRouterModelConfig):
         super().__init__(config=config)
+        # Optional pause before each move, e.g. to watch a game play out live. Off by default
+        # so batch runs aren't dominated by artificial latency.
+        self._delay_s = self.config.settings.get("artificial_delay_s", 0.0)
+        # Navigate tool found in the last tools list seen; a game passes the same list every turn
+        self._navigate_tool_source: Optional[List[Dict[str, Any]]] = None
+        self._navigate_tool: Optional[Dict[str, Any]] = None
+        # Tool call ids only need to be unique within a game, so a counter will do
+        self._tool_call_ids = itertools.count()
 
     def _calculate_cost(
         self,
@@ -51,13 +57,15 @@ class RandomModel(LanguageModel):
         game_state: GameState,
     ) -> AssistantMessage:
         """Generates a response by randomly selecting a link from the context."""
-        start_time = time.time()
-        await asyncio.sleep(1.0)
+        start_time = datetime.now()
+        start_perf = time.perf_counter()
+        if self._delay_s:
+            await asyncio.sleep(self._delay_s)
 
         # 2. Create zero-cost metrics since this is not a real API call
         metrics = ModelCallMetrics(
-            response_time_ms=(time.time() - start_time) * 1000,
-            request_timestamp=datetime.now()
+            response_time_ms=(time.perf_counter() - start_perf) * 1000,
+            request_timestamp=start_time
         )
 
         # 3. If no links are available, return a message with no tool call
@@ -67,12 +75,11 @@ class RandomModel(LanguageModel):
                 metrics=metrics
             )
 
-        # Find the navigate tool (assuming it exists)
-        navigate_tool = None
-        for tool in tools:
-            if tool["name"] == "navigate":
-                navigate_tool = tool
-                break
+        # Find the navigate tool, only rescanning when the game hands us a different tools list
+        if tools is not self._navigate_tool_source:
+            self._navigate_tool = next((tool for tool in tools if tool["name"] == "navigate"), None)
+            self._navigate_tool_source = tools
+        navigate_tool = self._navigate_tool
         
         if not navigate_tool:
             return AssistantMessage(
@@ -83,7 +90,7 @@ class RandomModel(LanguageModel):
         # 4. Randomly select a link and create a tool call
         selected_link = random.choice(game_state.current_page.links)
         tool_call = AssistantToolCall(
-            id=f"tool_{uuid.uuid4().hex[:10]}",
+            id=f"tool_{next(self._tool_call_ids):08x}",
             name="navigate",
             arguments={"to_page_title": selected_link}
         )
@@ -0,0 +1,83 @@
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from wiki_arena.types import AssistantMessage, ModelCallMetrics
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESPONSE_CACHE_SIZE = 1024
+DEFAULT_RESPONSE_CACHE_TTL_SECONDS = 3600.0
+
+# Shared by every model that opts in; see `ResponseCache.from_settings`
+_shared_cache: Optional["ResponseCache"] = None
+
+
+class ResponseCache:
+    """
+    In-process LRU cache of assistant responses, keyed by the exact provider request.
+
+    A hit skips the API call entirely. Hits are returned with zeroed metrics since nothing
+    was billed for them.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_RESPONSE_CACHE_SIZE,
+        ttl_seconds: float = DEFAULT_RESPONSE_CACHE_TTL_SECONDS,
+    ):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        # { request_key: (expires_at, AssistantMessage) }, least recently used first
+        self._entries: "OrderedDict[str, Tuple[float, AssistantMessage]]" = OrderedDict()
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any]) -> Optional["ResponseCache"]:
+        """
+        Return the process-wide cache if the model settings opt in with `cache_responses`.
+
+        Caching is off by default: replaying a response removes the sampling variance between
+        repeated benchmark games. It also requires `temperature` to be set to 0 explicitly, since
+        providers sample at their default temperature when none is sent.
+
+        Models are created per game, so the cache is shared by every model instance; entries are
+        keyed by model id as well as the request, so models never see each other's responses.
+        """
+        global _shared_cache
+        if not settings.get("cache_responses"):
+            return None
+        if settings.get("temperature") != 0:
+            logger.warning("cache_responses ignored: responses are only cached when temperature is set to 0")
+            return None
+        if _shared_cache is None:
+            _shared_cache = cls()
+        return _shared_cache
+
+    @staticmethod
+    def make_key(request: Any) -> str:
+        """Hash a JSON-serializable provider request into a cache key."""
+        payload = json.dumps(request, sort_keys=True, separators=(",", ":")).encode()
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[AssistantMessage]:
+        """Return a copy of the cached response for `key`, if present and fresh."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, message = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return message.model_copy(update={"metrics": ModelCallMetrics()})
+
+    def put(self, key: str, message: AssistantMessage) -> None:
+        """Store a response, evicting the least recently used entries beyond the size limit."""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, message)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
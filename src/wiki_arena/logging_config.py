@@ -5,8 +5,6 @@ Provides consistent, development-friendly logging across all components.
 
 import logging
 import sys
-from rich.logging import RichHandler
-from rich.console import Console
 from typing import Optional
 
 def setup_logging(
@@ -33,6 +31,10 @@ def setup_logging(
         root_logger.removeHandler(handler)
     
     if use_rich:
+        # Imported here so plain-text (production) logging never loads rich
+        from rich.console import Console
+        from rich.logging import RichHandler
+
         # Rich handler for beautiful terminal output
         console = Console(file=sys.stderr)  # Log to stderr by convention
         
@@ -1,18 +1,19 @@
 import asyncio
 import json
 import logging
+from collections import Counter
 from datetime import datetime
 from typing import Optional
 
 import typer
 
 from wiki_arena.game import Game
-from wiki_arena.types import GameConfig, GameResult
+from wiki_arena.types import GameConfig, GameResult, GameState
 from wiki_arena.storage import GameStorageService, StorageConfig
 from wiki_arena.tools import get_tools
 from wiki_arena.openrouter import create_openrouter_model as create_model
 from wiki_arena.wikipedia import LiveWikiService
-from wiki_arena.wikipedia.task_selector import get_random_task_async
+from wiki_arena.wikipedia.task_selector import WikipediaTaskSelector
 
 
 app = typer.Typer()
@@ -32,11 +33,28 @@ def main(
         "-s",
         help="The maximum number of steps allowed in the game.",
     ),
+    games: int = typer.Option(
+        1,
+        "--games",
+        "-n",
+        min=1,
+        help="The number of games to run.",
+    ),
+    concurrency: int = typer.Option(
+        4,
+        "--concurrency",
+        "-c",
+        min=1,
+        help="The maximum number of games played at the same time.",
+    ),
 ):
     """
-    Run a Wiki Arena game from the command line.
+    Run one or more Wiki Arena games from the command line.
     """
-    asyncio.run(run_game_async(model_id=model_id, max_steps=max_steps))
+    if games > 1:
+        asyncio.run(run_games_async(n=games, model_id=model_id, max_steps=max_steps, concurrency=concurrency))
+    else:
+        asyncio.run(run_game_async(model_id=model_id, max_steps=max_steps))
 
 
 async def run_game_async(model_id: str, max_steps: int):
@@ -50,12 +68,62 @@ async def run_game_async(model_id: str, max_steps: int):
     wiki_service = LiveWikiService()
     logger.info("LiveWikiService created.")
 
+    try:
+        await _play_game(wiki_service, GameStorageService(StorageConfig()), model_id, max_steps)
+    finally:
+        # 8. Application shutdown
+        await wiki_service.aclose()
+        logger.info("Application shutting down.")
+
+
+async def run_games_async(n: int, model_id: str, max_steps: int, concurrency: int):
+    """
+    Run `n` games at once, with at most `concurrency` in progress at any time.
+
+    The games share one wiki service and storage service, so task selection, page
+    fetches and connections are pooled across them. Wall time is bounded by the
+    slowest games instead of the sum of all of them.
+    """
+    from wiki_arena.logging_config import setup_logging
+
+    setup_logging(level="INFO")
+    logger = logging.getLogger(__name__)
+
+    wiki_service = LiveWikiService()
+    storage_service = GameStorageService(StorageConfig())
+    game_slots = asyncio.Semaphore(concurrency)
+
+    async def play_in_slot():
+        async with game_slots:
+            return await _play_game(wiki_service, storage_service, model_id, max_steps)
+
+    try:
+        final_states = await asyncio.gather(*(play_in_slot() for _ in range(n)))
+    finally:
+        await wiki_service.aclose()
+
+    finished = [state for state in final_states if state is not None]
+    status_counts = Counter(state.status.value for state in finished)
+    logger.info(f"Batch finished: {len(finished)}/{n} games completed.")
+    for status, count in sorted(status_counts.items()):
+        logger.info(f"  {status}: {count}")
+
+
+async def _play_game(
+    wiki_service: LiveWikiService,
+    storage_service: GameStorageService,
+    model_id: str,
+    max_steps: int,
+) -> Optional[GameState]:
+    """Play a single game on a random task and store its result. Returns the final state."""
+    logger = logging.getLogger(__name__)
+
     try:
         # 4. Select a random task
-        task = await get_random_task_async()
+        task = await WikipediaTaskSelector(live_wiki_service=wiki_service).select_task_async()
         if not task:
             logger.error("Could not retrieve a valid task. Exiting.")
-            return
+            return None
 
         # 5. Create game configuration from the task
         # Create model using simplified system (no config needed!)
@@ -71,10 +139,7 @@ async def run_game_async(model_id: str, max_steps: int):
             max_steps=max_steps
         )
 
-        # 5.5. Initialize game storage service
-        storage_config = StorageConfig()  # Use default configuration for now
-        storage_service = GameStorageService(storage_config)
-        logger.info(f"Game storage configured: {storage_config.storage_path}")
+        logger.info(f"Game storage configured: {storage_service.config.storage_path}")
 
         # Fetch the start page and tools needed to initialize the game
         start_page = await wiki_service.get_page(game_config.start_page_title)
@@ -101,7 +166,8 @@ async def run_game_async(model_id: str, max_steps: int):
         # Store game result
         try:
             game_result = GameResult.from_game_state(final_state, model.config.id)
-            storage_success = storage_service.store_game(game_result)
+            # Write from a worker thread so concurrent games don't queue behind disk I/O
+            storage_success = await asyncio.to_thread(storage_service.store_game, game_result)
 
             if storage_success:
                 logger.info(f"Game result stored successfully")
@@ -110,7 +176,10 @@ async def run_game_async(model_id: str, max_steps: int):
         except Exception as e:
             logger.error(f"Error storing game result: {e}", exc_info=True)
 
-        logger.info(json.dumps([msg.model_dump(mode="json") for msg in game.state.context], indent=2))
+        # The full context is large; only serialize it when it will be logged
+        if logger.isEnabledFor(logging.DEBUG):
+            context = [msg.model_dump(mode="json", exclude_none=True) for msg in game.state.context]
+            logger.debug("Game context: %s", json.dumps(context, separators=(",", ":")))
 
         # Print results
         logger.info("Game finished.")
@@ -129,16 +198,14 @@ async def run_game_async(model_id: str, max_steps: int):
         end_time = datetime.now()
         duration = (end_time - final_state.start_timestamp).total_seconds()
         logger.info(f"Duration: {duration:.2f}s")
+        return final_state
 
     except Exception as e:
         logger.critical(
             f"An unexpected error occurred during application runtime: {e}",
             exc_info=True,
         )
-
-    finally:
-        # 8. Application shutdown
-        logger.info("Application shutting down.")
+        return None
 
 
 if __name__ == "__main__":
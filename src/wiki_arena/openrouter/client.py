@@ -1,18 +1,24 @@
 import os
-from openai import OpenAI
+from functools import lru_cache
+
+from openai import AsyncOpenAI
 from dotenv import load_dotenv
 
 load_dotenv()
 
-def create_client() -> OpenAI:
+@lru_cache(maxsize=1)
+def create_client() -> AsyncOpenAI:
     """
-    Creates and configures an OpenAI client to connect to the OpenRouter API.
+    Creates and configures an async OpenAI client to connect to the OpenRouter API.
+
+    The client is created once per process and shared by every model instance,
+    so all games reuse the same HTTP connection pool.
     """
     api_key = os.getenv("OPENROUTER_API_KEY")
     if not api_key:
         raise ValueError("OPENROUTER_API_KEY environment variable not set.")
 
-    return OpenAI(
+    return AsyncOpenAI(
         base_url="https://openrouter.ai/api/v1",
         api_key=api_key,
     )
\ No newline at end of file
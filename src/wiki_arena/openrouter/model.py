@@ -1,5 +1,6 @@
 import json
 import logging
+import time
 from datetime import datetime
 from typing import Any, Dict, List
 
@@ -86,7 +87,7 @@ class OpenRouterLanguageModel(LanguageModel):
                         "type": "function",
                         "function": {
                             "name": tc.name,
-                            "arguments": json.dumps(tc.arguments),
+                            "arguments": json.dumps(tc.arguments, sort_keys=True, separators=(",", ":")),
                         },
                     }
                     for tc in turn.tool_calls
@@ -106,7 +107,7 @@ class OpenRouterLanguageModel(LanguageModel):
         context: List[ContextMessage],
         game_state: GameState,
     ) -> AssistantMessage:
-        formatted_tools = self._format_tools(tools)
+        formatted_tools = self._get_formatted_tools(tools)
         messages = self._format_context(context)
 
         extra_headers = {
@@ -117,7 +118,9 @@ class OpenRouterLanguageModel(LanguageModel):
 
         try:
             start_time = datetime.now()
-            response = self.client.chat.completions.create(
+            start_perf = time.perf_counter()
+            # Awaited so a pending request doesn't block the event loop other games run on
+            response = await self.client.chat.completions.create(
                 model=self.config.id,
                 messages=messages,
                 tools=formatted_tools,
@@ -126,12 +129,13 @@ class OpenRouterLanguageModel(LanguageModel):
                 extra_body=extra_body,
                 **self.config.settings,
             )
-            duration_ms = (datetime.now() - start_time).total_seconds() * 1000
+            duration_ms = (time.perf_counter() - start_perf) * 1000
 
             usage = response.usage
             prompt_tokens = usage.prompt_tokens
-            if self.config.id.includes("gemini"):
-                prompt_tokens -= getattr(usage, "prompt_tokens_details", {}).get("cached_tokens", 0)
+            if "gemini" in self.config.id:
+                prompt_details = getattr(usage, "prompt_tokens_details", None)
+                prompt_tokens -= getattr(prompt_details, "cached_tokens", 0) or 0
 
             completion_tokens = usage.completion_tokens
             total_tokens = usage.total_tokens
@@ -1,6 +1,7 @@
 import json
 import csv
 import logging
+import threading
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
@@ -15,6 +16,8 @@ class GameStorageService:
     def __init__(self, config: Optional[StorageConfig] = None):
         self.config = config or StorageConfig()
         self.logger = logging.getLogger(__name__)
+        # Games may be stored from worker threads; keep their lines from interleaving
+        self._write_lock = threading.Lock()
         
     def should_store_game(self, game_result: GameResult) -> bool:
         """Determine if a game should be stored based on configuration."""
@@ -51,7 +54,7 @@ class GameStorageService:
             # Convert to JSON and append to file
             json_line = game_result.model_dump_json()
             
-            with open(jsonl_path, 'a', encoding='utf-8') as f:
+            with self._write_lock, open(jsonl_path, 'a', encoding='utf-8') as f:
                 f.write(json_line + '\n')
                 
             self.logger.debug(f"Stored game {game_result.game_id} to JSONL: {jsonl_path}")
@@ -1,5 +1,6 @@
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, FrozenSet
 from datetime import datetime
+from functools import cached_property
 from enum import Enum
 from pydantic import BaseModel, Field, field_validator, ValidationInfo
 
@@ -140,12 +141,24 @@ class Page(BaseModel):
     # TODO(hunter): this should be a list of a defined type
     links: List[str] = Field([], description="A list of link texts found on the page.")
 
+    @cached_property
+    def links_block(self) -> str:
+        """Newline-joined links, built once per page and reused by every prompt that lists them."""
+        return "\n".join(self.links)
+
+    @cached_property
+    def link_set(self) -> FrozenSet[str]:
+        """Links as a frozenset, for O(1) membership checks when validating a move."""
+        return frozenset(self.links)
+
 class GameConfig(BaseModel):
     """Holds the initial settings and configuration for a game."""
     start_page_title: str = Field(..., description="The title of the starting Wikipedia page.")
     target_page_title: str = Field(..., description="The title of the target Wikipedia page.")
     max_steps: int = Field(30, description="The maximum number of steps allowed for the game.")
     system_prompt_template: Optional[str] = Field(DEFAULT_SYSTEM_PROMPT_TEMPLATE, description="The system prompt for the language model.")
+    max_context_turns: Optional[int] = Field(None, description="If set, only the last N moves are sent to the model in full; earlier moves are summarized.")
+    max_context_tokens: Optional[int] = Field(None, description="If set, older moves are summarized until the context sent to the model fits this approximate token budget.")
     
 class Move(BaseModel):
     """Records a single step taken by a player."""
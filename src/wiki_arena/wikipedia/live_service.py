@@ -1,19 +1,91 @@
+import asyncio
 import logging
+import time
 import httpx
 import urllib.parse
-from typing import List
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from wiki_arena.types import Page
 
+# Pool limits for the service's HTTP client. Every game shares one LiveWikiService, so keep
+# enough warm keep-alive connections that concurrent page fetches skip the TCP/TLS handshake.
+DEFAULT_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30.0)
+
+# Fetched pages are kept in an in-memory LRU so that pages revisited within or across games
+# (popular hubs, retries after invalid moves) don't cost another paginated API round trip.
+DEFAULT_PAGE_CACHE_SIZE = 1024
+DEFAULT_PAGE_CACHE_TTL_SECONDS = 3600.0
+
+
+@lru_cache(maxsize=4096)
+def _title_to_url(language: str, title: str) -> str:
+    """Build the canonical article URL for a title (used when the API omits `fullurl`)."""
+    return f"https://{language}.wikipedia.org/wiki/{urllib.parse.quote(title.replace(' ', '_'), safe=':/')}"
+
 class LiveWikiService:
     """
     Service for interacting directly with the live Wikipedia API.
     All methods are asynchronous.
     """
-    def __init__(self, language: str = "en"):
+    def __init__(
+        self,
+        language: str = "en",
+        client: Optional[httpx.AsyncClient] = None,
+        page_cache_size: int = DEFAULT_PAGE_CACHE_SIZE,
+        page_cache_ttl_seconds: float = DEFAULT_PAGE_CACHE_TTL_SECONDS,
+    ):
+        """
+        Args:
+            language: Wikipedia language edition to query.
+            client: Optional externally-owned HTTP client to share a connection pool with
+                other services. If omitted, the service lazily creates (and owns) its own.
+            page_cache_size: Maximum number of pages kept by `get_page` (0 disables caching).
+            page_cache_ttl_seconds: How long a cached page is served before being refetched.
+        """
         self.language = language
         self.base_url = f"https://{language}.wikipedia.org/w/api.php"
         self.logger = logging.getLogger(__name__)
+        self._client = client
+        self._owns_client = client is None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.page_cache_size = page_cache_size
+        self.page_cache_ttl_seconds = page_cache_ttl_seconds
+        # { (title, include_all_namespaces): (expires_at, Page) }, least recently used first
+        self._page_cache: "OrderedDict[Tuple[str, bool], Tuple[float, Page]]" = OrderedDict()
+        # In-flight page fetches, so concurrent misses for the same page share one request
+        self._pending_fetches: Dict[Tuple[str, bool], "asyncio.Future[Page]"] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use."""
+        if self._owns_client:
+            # Pooled connections are bound to the event loop that opened them, so an owned
+            # client serves only that loop. Build one service per loop (or share one through
+            # `async with LiveWikiService(...)`) instead of carrying it across asyncio.run calls.
+            loop = asyncio.get_running_loop()
+            if self._client is None:
+                self._client = httpx.AsyncClient(limits=DEFAULT_HTTP_LIMITS)
+                self._client_loop = loop
+            elif self._client_loop is not loop:
+                raise RuntimeError(
+                    "LiveWikiService was first used on a different event loop; "
+                    "create a service per event loop or call aclose() before reusing it"
+                )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if this service created it."""
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+
+    async def __aenter__(self) -> "LiveWikiService":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
 
     async def get_random_pages(self, count: int = 20) -> List[str]:
         """Get random pages."""
@@ -22,9 +94,8 @@ class LiveWikiService:
             "rnnamespace": "0", "rnfilterredir": "nonredirects", "rnlimit": str(count)
         }
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(self.base_url, params=params)
-                response.raise_for_status()
+            response = await self._get_client().get(self.base_url, params=params, timeout=5.0)
+            response.raise_for_status()
             data = response.json()
             if "query" not in data or "random" not in data["query"]:
                 raise ConnectionError("Unexpected API response format for get_random_pages")
@@ -42,9 +113,8 @@ class LiveWikiService:
             "titles": page_title, "pllimit": "1", "plnamespace": "0"
         }
         try:
-            async with httpx.AsyncClient(timeout=3.0) as client:
-                response = await client.get(self.base_url, params=params)
-                response.raise_for_status()
+            response = await self._get_client().get(self.base_url, params=params, timeout=3.0)
+            response.raise_for_status()
             data = response.json()
             if "query" in data and "pages" in data["query"]:
                 page_data = next(iter(data["query"]["pages"].values()))
@@ -63,9 +133,8 @@ class LiveWikiService:
             "bltitle": page_title, "blnamespace": "0", "bllimit": "1"
         }
         try:
-            async with httpx.AsyncClient(timeout=3.0) as client:
-                response = await client.get(self.base_url, params=params)
-                response.raise_for_status()
+            response = await self._get_client().get(self.base_url, params=params, timeout=3.0)
+            response.raise_for_status()
             data = response.json()
             if "query" in data and "backlinks" in data["query"]:
                 has_backlinks = len(data["query"]["backlinks"]) > 0
@@ -76,10 +145,66 @@ class LiveWikiService:
             self.logger.debug(f"Error checking incoming links for '{page_title}': {e}")
             return False
 
+    def _get_cached_page(self, key: Tuple[str, bool]) -> Optional[Page]:
+        """Return a cached page if present and fresh, marking it as recently used."""
+        entry = self._page_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, page = entry
+        if expires_at < time.monotonic():
+            del self._page_cache[key]
+            return None
+        self._page_cache.move_to_end(key)
+        return page
+
+    def _cache_page(self, key: Tuple[str, bool], page: Page) -> None:
+        """Store a page, evicting the least recently used entries beyond the size limit."""
+        if self.page_cache_size <= 0:
+            return
+        self._page_cache[key] = (time.monotonic() + self.page_cache_ttl_seconds, page)
+        self._page_cache.move_to_end(key)
+        while len(self._page_cache) > self.page_cache_size:
+            self._page_cache.popitem(last=False)
+
     async def get_page(self, page_title: str, include_all_namespaces: bool = False) -> Page:
         """
         Fetch a full Wikipedia page, including all its links using pagination.
+
+        Results are cached under both the requested and the resolved (post-redirect) title.
+        Pages are treated as read-only, so the same `Page` may be handed to several games.
         """
+        key = (page_title, include_all_namespaces)
+        page = self._get_cached_page(key)
+        if page is not None:
+            self.logger.debug(f"Page cache hit for '{page_title}'")
+            return page
+
+        # Several games often land on the same popular page at once; let the first miss fetch it
+        # and have the rest await that fetch instead of issuing their own requests.
+        fetch = self._pending_fetches.get(key)
+        if fetch is None or fetch.get_loop() is not asyncio.get_running_loop():
+            fetch = asyncio.ensure_future(self._fetch_and_cache_page(key))
+            self._pending_fetches[key] = fetch
+            fetch.add_done_callback(lambda done: self._forget_pending_fetch(key, done))
+        else:
+            self.logger.debug(f"Joining in-flight fetch for '{page_title}'")
+        # Shielded so a cancelled caller doesn't cancel the fetch for everyone else waiting on it
+        return await asyncio.shield(fetch)
+
+    def _forget_pending_fetch(self, key: Tuple[str, bool], fetch: "asyncio.Future[Page]") -> None:
+        if self._pending_fetches.get(key) is fetch:
+            del self._pending_fetches[key]
+
+    async def _fetch_and_cache_page(self, key: Tuple[str, bool]) -> Page:
+        page_title, include_all_namespaces = key
+        page = await self._fetch_page(page_title, include_all_namespaces)
+        self._cache_page(key, page)
+        if page.title != page_title:
+            self._cache_page((page.title, include_all_namespaces), page)
+        return page
+
+    async def _fetch_page(self, page_title: str, include_all_namespaces: bool) -> Page:
+        """Fetch a page and all of its links from the API, following link pagination."""
         all_links = []
         plcontinue = None
         page_info = {}
@@ -96,9 +221,8 @@ class LiveWikiService:
                 params["plcontinue"] = plcontinue
             
             try:
-                async with httpx.AsyncClient(timeout=10.0) as client:
-                    response = await client.get(self.base_url, params=params)
-                    response.raise_for_status()
+                response = await self._get_client().get(self.base_url, params=params, timeout=10.0)
+                response.raise_for_status()
                 data = response.json()
             except httpx.RequestError as e:
                 self.logger.error(f"Failed to fetch page '{page_title}': {e}")
@@ -114,7 +238,7 @@ class LiveWikiService:
             if not page_info:
                 page_info = {
                     "title": page["title"],
-                    "url": page.get("fullurl", f"https://en.wikipedia.org/wiki/{urllib.parse.quote(page['title'])}")
+                    "url": page.get("fullurl") or _title_to_url(self.language, page["title"]),
                 }
             
             links_batch = page.get("links", [])
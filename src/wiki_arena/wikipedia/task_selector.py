@@ -119,13 +119,13 @@ async def get_random_task_async(
         excluded_prefixes: Optional[Set[str]] = None
     ) -> Optional[Task]:
     """Get a random Wikipedia task with efficient validation."""
-    service = LiveWikiService(language=language)
-    selector = WikipediaTaskSelector(
-        live_wiki_service=service,
-        max_retries=max_retries,
-        excluded_prefixes=excluded_prefixes
-    )
-    return await selector.select_task_async()
+    async with LiveWikiService(language=language) as service:
+        selector = WikipediaTaskSelector(
+            live_wiki_service=service,
+            max_retries=max_retries,
+            excluded_prefixes=excluded_prefixes
+        )
+        return await selector.select_task_async()
 
 def get_random_task(
         language: str = "en",
@@ -0,0 +1,98 @@
+"""
+GameCoordinator tests: game slots, the shared model request limiter and game_started events.
+Games run offline against a two-page wiki with the random model.
+"""
+
+import asyncio
+import logging
+
+import pytest
+
+from wiki_arena import EventBus, GameEvent
+from wiki_arena.game import Game
+from wiki_arena.types import GameConfig, GameStatus, Page
+from wiki_arena.openrouter.config import OpenRouterModelConfig, Pricing, TopProvider
+from wiki_arena.language_models.random_model import RandomModel
+from wiki_arena.tools import get_tools
+from backend.coordinators.game_coordinator import GameCoordinator
+
+PAGES = {
+    "Start": Page(title="Start", url="https://en.wikipedia.org/wiki/Start", links=["Target"]),
+    "Target": Page(title="Target", url="https://en.wikipedia.org/wiki/Target", links=["Start"]),
+}
+
+
+class FakeWikiService:
+    async def get_page(self, title: str, include_all_namespaces: bool = False) -> Page:
+        return PAGES[title]
+
+
+def _random_model() -> RandomModel:
+    return RandomModel(OpenRouterModelConfig(
+        id="random/random",
+        name="Random",
+        created=0,
+        description="Picks a random link.",
+        context_length=1_000_000,
+        pricing=Pricing(prompt=0.0, completion=0.0, request=0.0, image=0.0),
+        top_provider=TopProvider(is_moderated=False),
+    ))
+
+
+def _add_game(coordinator: GameCoordinator) -> str:
+    """Register a one-move game with the coordinator without going through models.json."""
+    game = Game(
+        config=GameConfig(start_page_title="Start", target_page_title="Target", max_steps=1),
+        wiki_service=coordinator.wiki_service,
+        language_model=_random_model(),
+        start_page=PAGES["Start"],
+        tools=get_tools(),
+        event_bus=coordinator.event_bus,
+        request_limiter=coordinator.model_request_limiter,
+    )
+    coordinator.active_games[game.id] = game
+    return game.id
+
+
+def test_model_request_limiter_only_exists_below_the_game_cap():
+    bus, wiki = EventBus(), FakeWikiService()
+
+    assert GameCoordinator(bus, wiki, max_concurrent_games=10, max_concurrent_model_requests=10).model_request_limiter is None
+    assert GameCoordinator(bus, wiki, max_concurrent_games=10, max_concurrent_model_requests=64).model_request_limiter is None
+
+    limited = GameCoordinator(bus, wiki, max_concurrent_games=10, max_concurrent_model_requests=4)
+    assert limited.model_request_limiter is not None
+    assert limited.model_request_limiter._value == 4
+
+
+@pytest.mark.asyncio
+async def test_queued_games_emit_game_started_when_they_get_a_slot(caplog):
+    bus = EventBus()
+    events = []
+
+    async def record(event: GameEvent):
+        events.append((event.type, event.game_id, event.data["game_state"].status))
+
+    bus.subscribe("game_started", record)
+    bus.subscribe("game_ended", record)
+
+    coordinator = GameCoordinator(bus, FakeWikiService(), max_concurrent_games=1)
+    first, second = _add_game(coordinator), _add_game(coordinator)
+
+    with caplog.at_level(logging.INFO, logger="wiki_arena.game"):
+        await coordinator.start_games([first, second])
+        await asyncio.gather(*coordinator.background_tasks.values())
+    await bus.drain()
+
+    # The second game only starts once the first has finished and released the single slot
+    assert [(event_type, game_id) for event_type, game_id, _ in events] == [
+        ("game_started", first),
+        ("game_ended", first),
+        ("game_started", second),
+        ("game_ended", second),
+    ]
+    assert events[0][2] == GameStatus.IN_PROGRESS
+    assert events[1][2] == GameStatus.WON
+    # Game.run still drives the NOT_STARTED -> IN_PROGRESS transition for backend games
+    assert f"Game {first} started." in caplog.text
+    assert f"Game {second} started." in caplog.text
@@ -6,6 +6,7 @@ from datetime import datetime
 from wiki_arena.language_models import create_model
 from wiki_arena.types import AssistantToolCall, ModelCallMetrics
 from wiki_arena.types import GameState, GameConfig, Page
+from wiki_arena.types import AssistantMessage, ModelConfig, SystemMessage, ToolResultMessage, UserMessage
 from mcp.types import Tool
 
 
@@ -144,7 +145,7 @@ class TestProviderAPICallStructure:
             mock_response.usage = MagicMock()
             mock_response.usage.input_tokens = 100
             mock_response.usage.output_tokens = 50
-            mock_client.messages.create.return_value = mock_response
+            mock_client.messages.create = AsyncMock(return_value=mock_response)
             
             # Create minimal test data
             game_state = GameState(
@@ -177,6 +178,28 @@ class TestProviderAPICallStructure:
             assert result.metrics.input_tokens == 100
             assert result.metrics.output_tokens == 50
 
+    def test_anthropic_context_merges_consecutive_user_turns(self):
+        """Test that a tool result and the following page message share one user message."""
+        from wiki_arena.language_models.anthropic_model import AnthropicModel
+
+        with patch.dict('os.environ', {'ANTHROPIC_API_KEY': 'test'}):
+            model = AnthropicModel(ModelConfig(provider="anthropic", model_name="claude-3-haiku-20240307"))
+        context = [
+            SystemMessage(content="Navigate from A to C"),
+            UserMessage(content="Links on A: B"),
+            AssistantMessage(tool_calls=[AssistantToolCall(id="call_1", name="navigate", arguments={"to_page_title": "B"})]),
+            ToolResultMessage(tool_call_id="call_1", content="Moved to B"),
+            UserMessage(content="Links on B: C"),
+        ]
+
+        _, messages = model._format_context(context)
+
+        assert [message["role"] for message in messages] == ["user", "assistant", "user"]
+        assert [block["type"] for block in messages[2]["content"]] == ["tool_result", "text"]
+        # The history before the newest page and the final block are both cache breakpoints
+        assert "cache_control" in messages[2]["content"][0]
+        assert "cache_control" in messages[2]["content"][1]
+
     @pytest.mark.asyncio
     async def test_openai_model_api_call_structure(self):
         """Test that OpenAIModel structures API calls correctly."""
@@ -194,7 +217,7 @@ class TestProviderAPICallStructure:
             mock_response.usage = MagicMock()
             mock_response.usage.prompt_tokens = 120
             mock_response.usage.completion_tokens = 60
-            mock_client.chat.completions.create.return_value = mock_response
+            mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
             
             # Create minimal test data
             game_state = GameState(
@@ -252,6 +275,37 @@ class TestCostCalculationIntegration:
                 assert calculated_cost > 0, f"Cost should be positive for {model_key}"
                 assert calculated_cost < 0.01, f"Cost seems too high for {model_key}: ${calculated_cost}"
 
+    @pytest.mark.asyncio
+    async def test_openai_cached_prompt_tokens_billed_at_discount(self):
+        """Test that OpenAI's cached prompt tokens are split out and billed at the cached rate."""
+        from wiki_arena.language_models.openai_model import OpenAIModel
+
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test'}):
+            model = OpenAIModel(ModelConfig(
+                provider="openai",
+                model_name="gpt-4o-mini-2024-07-18",
+                input_cost_per_1m_tokens=1.0,
+                output_cost_per_1m_tokens=2.0,
+            ))
+
+        mock_response = MagicMock()
+        mock_response.usage = MagicMock(
+            prompt_tokens=1000,
+            completion_tokens=100,
+            total_tokens=1100,
+            prompt_tokens_details=MagicMock(cached_tokens=800),
+        )
+        mock_response.choices = [MagicMock(message=MagicMock(content="Going to B", tool_calls=None))]
+
+        with patch.object(model, 'client') as mock_client:
+            mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+            result = await model.generate_response([], [UserMessage(content="Links: B")], game_state=None)
+
+        assert result.metrics.input_tokens == 200
+        assert result.metrics.cache_read_input_tokens == 800
+        expected_cost = (200 * 1.0 + 800 * 1.0 * OpenAIModel.CACHE_READ_MULTIPLIER + 100 * 2.0) / 1_000_000
+        assert abs(result.metrics.estimated_cost_usd - expected_cost) < 1e-12
+
     def test_move_metrics_creation(self):
         """Test that MoveMetrics objects are created correctly."""
         # Test typical metrics
@@ -283,7 +337,7 @@ class TestProviderErrorHandling:
         with patch.object(model, 'client') as mock_client:
             # Mock API error
             from anthropic import AnthropicError
-            mock_client.messages.create.side_effect = AnthropicError("API Error")
+            mock_client.messages.create = AsyncMock(side_effect=AnthropicError("API Error"))
             
             game_state = GameState(
                 game_id="test",
@@ -313,7 +367,7 @@ class TestProviderErrorHandling:
         with patch.object(model, 'client') as mock_client:
             # Mock API error
             from openai import OpenAIError
-            mock_client.chat.completions.create.side_effect = OpenAIError("API Error")
+            mock_client.chat.completions.create = AsyncMock(side_effect=OpenAIError("API Error"))
             
             game_state = GameState(
                 game_id="test",
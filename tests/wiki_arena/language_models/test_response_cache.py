@@ -0,0 +1,104 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from wiki_arena.language_models.openai_model import OpenAIModel
+from wiki_arena.language_models.response_cache import ResponseCache
+from wiki_arena.types import (
+    AssistantMessage,
+    AssistantToolCall,
+    ModelCallMetrics,
+    ModelConfig,
+    SystemMessage,
+    UserMessage,
+)
+
+
+def _message() -> AssistantMessage:
+    return AssistantMessage(
+        content="Going to B",
+        tool_calls=[AssistantToolCall(id="call_1", name="navigate", arguments={"to_page_title": "B"})],
+        metrics=ModelCallMetrics(input_tokens=100, output_tokens=10, estimated_cost_usd=0.01),
+    )
+
+
+def test_key_ignores_dict_ordering():
+    """Test that equivalent requests hash to the same key."""
+    assert ResponseCache.make_key({"a": 1, "b": [1, 2]}) == ResponseCache.make_key({"b": [1, 2], "a": 1})
+    assert ResponseCache.make_key({"a": 1}) != ResponseCache.make_key({"a": 2})
+
+
+def test_hit_returns_copy_with_zero_cost():
+    """Test that a cached response is replayed without its original billing metrics."""
+    cache = ResponseCache()
+    key = ResponseCache.make_key(["model", "request"])
+    cache.put(key, _message())
+
+    hit = cache.get(key)
+
+    assert hit is not None
+    assert hit.tool_calls[0].arguments == {"to_page_title": "B"}
+    assert hit.metrics.estimated_cost_usd == 0.0
+    assert hit.metrics.input_tokens == 0
+
+
+def test_evicts_least_recently_used_and_expired_entries():
+    """Test that the cache respects its size limit and TTL."""
+    cache = ResponseCache(maxsize=2)
+    cache.put("a", _message())
+    cache.put("b", _message())
+    cache.get("a")
+    cache.put("c", _message())
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+
+    expired = ResponseCache(ttl_seconds=-1)
+    expired.put("a", _message())
+    assert expired.get("a") is None
+
+
+def test_from_settings_is_opt_in_and_requires_explicit_zero_temperature():
+    """Test that caching is only enabled when requested and temperature is explicitly 0."""
+    assert ResponseCache.from_settings({}) is None
+    assert ResponseCache.from_settings({"cache_responses": True, "temperature": 0.7}) is None
+    # Without a temperature the provider samples at its default, so nothing may be cached
+    assert ResponseCache.from_settings({"cache_responses": True}) is None
+
+    cache = ResponseCache.from_settings({"cache_responses": True, "temperature": 0})
+    assert isinstance(cache, ResponseCache)
+    assert ResponseCache.from_settings({"cache_responses": True, "temperature": 0}) is cache
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_across_model_instances():
+    """Test that a second model instance (i.e. the next game) is served from the shared cache."""
+    settings = {"cache_responses": True, "temperature": 0}
+    config = ModelConfig(
+        provider="openai",
+        model_name="gpt-cache-test",
+        settings=settings,
+        input_cost_per_1m_tokens=1.0,
+        output_cost_per_1m_tokens=1.0,
+    )
+    context = [SystemMessage(content="Navigate from A to C"), UserMessage(content="Links on A: B")]
+
+    mock_response = MagicMock()
+    mock_response.usage = MagicMock(prompt_tokens=100, completion_tokens=10, total_tokens=110, prompt_tokens_details=None)
+    mock_response.choices = [MagicMock(message=MagicMock(content="Going to B", tool_calls=None))]
+    create = AsyncMock(return_value=mock_response)
+
+    with patch.dict('os.environ', {'OPENAI_API_KEY': 'test'}):
+        first_game_model = OpenAIModel(config)
+        second_game_model = OpenAIModel(config)
+    for model in (first_game_model, second_game_model):
+        model.client = MagicMock()
+        model.client.chat.completions.create = create
+
+    first = await first_game_model.generate_response([], context, game_state=None)
+    second = await second_game_model.generate_response([], context, game_state=None)
+
+    create.assert_awaited_once()
+    assert create.call_args.kwargs["temperature"] == 0
+    assert second.content == first.content
+    assert second.metrics.estimated_cost_usd == 0.0
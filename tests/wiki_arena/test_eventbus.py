@@ -133,4 +133,80 @@ class TestEventBus:
         
         # Add another subscriber
         event_bus.subscribe("count_test", dummy_handler)
-        assert event_bus.get_subscriber_count("count_test") == 2 
\ No newline at end of file
+        assert event_bus.get_subscriber_count("count_test") == 2
+
+    @pytest.mark.asyncio
+    async def test_publish_unknown_type_does_not_register(self, event_bus: EventBus):
+        """Test that publishing an unsubscribed event type leaves no subscriber entry behind."""
+        await event_bus.publish(GameEvent(type="never_subscribed", game_id="ghost_game", data={}))
+
+        assert event_bus.get_subscriber_count("never_subscribed") == 0
+        assert "never_subscribed" not in event_bus._subscribers
+
+    @pytest.mark.asyncio
+    async def test_single_failing_handler_is_isolated(self, event_bus: EventBus):
+        """Test that a lone failing handler does not propagate out of publish."""
+        calls = []
+
+        async def failing_handler(event: GameEvent):
+            calls.append(event.game_id)
+            raise ValueError("Intentional test failure")
+
+        event_bus.subscribe("single_error_test", failing_handler)
+
+        # Should not raise any exception
+        await event_bus.publish(GameEvent(type="single_error_test", game_id="solo_game", data={}))
+
+        assert calls == ["solo_game"]
+
+    @pytest.mark.asyncio
+    async def test_publish_nowait_delivers_in_order(self, event_bus: EventBus):
+        """Test that queued events are delivered in publish order once drained."""
+        received = []
+
+        async def slow_handler(event: GameEvent):
+            await asyncio.sleep(0.01)
+            received.append(event.type)
+
+        event_bus.subscribe("move_completed", slow_handler)
+        event_bus.subscribe("game_ended", slow_handler)
+
+        event_bus.publish_nowait(GameEvent(type="move_completed", game_id="queued_game", data={}))
+        event_bus.publish_nowait(GameEvent(type="game_ended", game_id="queued_game", data={}))
+
+        # Publishing must not wait for handlers
+        assert received == []
+
+        await event_bus.shutdown()
+        assert received == ["move_completed", "game_ended"]
+
+    @pytest.mark.asyncio
+    async def test_slow_game_does_not_block_other_games(self, event_bus: EventBus):
+        """Test that queued events for one game are delivered while another game's handler is stuck."""
+        received = []
+        release_slow_game = asyncio.Event()
+
+        async def handler(event: GameEvent):
+            if event.game_id == "slow_game":
+                await release_slow_game.wait()
+            received.append((event.game_id, event.data["step"]))
+
+        event_bus.subscribe("move_completed", handler)
+
+        for step in range(2):
+            event_bus.publish_nowait(GameEvent(type="move_completed", game_id="slow_game", data={"step": step}))
+            event_bus.publish_nowait(GameEvent(type="move_completed", game_id="fast_game", data={"step": step}))
+
+        # The fast game's events arrive even though the slow game's first handler is still waiting
+        await asyncio.wait_for(self._until(lambda: len(received) == 2), timeout=1)
+        assert received == [("fast_game", 0), ("fast_game", 1)]
+
+        release_slow_game.set()
+        await event_bus.drain()
+        assert received[2:] == [("slow_game", 0), ("slow_game", 1)]
+        assert event_bus._consumers == {}
+
+    @staticmethod
+    async def _until(condition):
+        while not condition():
+            await asyncio.sleep(0)
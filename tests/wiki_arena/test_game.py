@@ -8,10 +8,12 @@ import asyncio
 from unittest.mock import patch
 from typing import List
 
-from wiki_arena.game import Game
+from wiki_arena.game import Game, _approx_tokens
 from wiki_arena.types import (
     GameConfig, GameState, GameStatus, Page, Move, GameError, ErrorType, ModelConfig
 )
+from wiki_arena.types import ContextMessage, SystemMessage, ToolResultMessage, UserMessage
+from wiki_arena.openrouter.config import OpenRouterModelConfig, Pricing, TopProvider
 from wiki_arena.wikipedia import LiveWikiService
 from wiki_arena.language_models import LanguageModel
 from wiki_arena.language_models.random_model import RandomModel
@@ -275,4 +277,217 @@ async def test_model_with_invalid_tool_name(game: Game):
 
     # Assert
     assert game.state.status == GameStatus.LOST_INVALID_MOVE
-    assert "unavailable tool" in game.state.error_message 
\ No newline at end of file
+    assert "unavailable tool" in game.state.error_message 
+
+# Small offline link graph for the context window tests
+WINDOW_TEST_LINKS = {
+    "A": ["B", "C"],
+    "B": ["C", "T"],
+    "C": ["A", "B"],
+    "T": ["A"],
+}
+
+
+class FakeWikiService:
+    """Serves pages from WINDOW_TEST_LINKS without touching the network."""
+
+    async def get_page(self, title: str, include_all_namespaces: bool = False) -> Page:
+        if title not in WINDOW_TEST_LINKS:
+            raise ValueError(f"Page does not exist: {title}")
+        return Page(title=title, url=f"https://en.wikipedia.org/wiki/{title}", links=WINDOW_TEST_LINKS[title])
+
+
+class ScriptedModel(LanguageModel):
+    """Navigates along a fixed path and records the context it was prompted with on every call."""
+
+    def __init__(self, path: List[str]):
+        super().__init__(OpenRouterModelConfig(
+            id="test/scripted",
+            name="Scripted",
+            created=0,
+            description="Follows a fixed path.",
+            context_length=1_000_000,
+            pricing=Pricing(prompt=0.0, completion=0.0, request=0.0, image=0.0),
+            top_provider=TopProvider(is_moderated=False),
+        ))
+        self.path = list(path)
+        self.prompts: List[List[ContextMessage]] = []
+
+    def _calculate_cost(self, prompt_tokens, completion_tokens, cache_creation_tokens=0, cache_read_tokens=0) -> float:
+        return 0.0
+
+    def _format_tools(self, mcp_tools):
+        return mcp_tools
+
+    def _format_context(self, context):
+        return context
+
+    async def generate_response(self, tools, context, game_state) -> AssistantMessage:
+        self.prompts.append(list(context))
+        step = len(self.prompts)
+        return AssistantMessage(
+            content=f"Step {step}",
+            tool_calls=[AssistantToolCall(
+                id=f"call_{step}", name="navigate", arguments={"to_page_title": self.path[step - 1]}
+            )],
+        )
+
+
+async def _play_window_game(path: List[str], event_bus: EventBus = None, **config_overrides) -> tuple:
+    """Play `path` from page A to target T; returns the game and the prompts the model saw."""
+    wiki_service = FakeWikiService()
+    model = ScriptedModel(path)
+    game = Game(
+        config=GameConfig(start_page_title="A", target_page_title="T", max_steps=10, **config_overrides),
+        wiki_service=wiki_service,
+        language_model=model,
+        start_page=await wiki_service.get_page("A"),
+        tools=get_tools(),
+        event_bus=event_bus,
+    )
+    await game.run()
+    return game, model.prompts
+
+
+def _assert_well_formed(prompt: List[ContextMessage]):
+    """The prompt starts with the system message, alternates user/assistant and pairs every tool result."""
+    assert isinstance(prompt[0], SystemMessage)
+    assert isinstance(prompt[1], UserMessage), "the conversation must open with a user turn"
+    assert isinstance(prompt[-1], UserMessage), "the model must be prompted from a user turn"
+    for previous, message in zip(prompt[1:], prompt[2:]):
+        if isinstance(message, AssistantMessage):
+            assert not isinstance(previous, AssistantMessage), "assistant turns must not be adjacent"
+        if isinstance(message, ToolResultMessage):
+            assert isinstance(previous, AssistantMessage)
+            assert message.tool_call_id == previous.tool_calls[0].id
+
+
+class TestContextWindow:
+    """Windowing of the context the model is prompted with (max_context_turns / max_context_tokens)."""
+
+    PATH = ["B", "C", "A", "B", "T"]
+
+    @pytest.mark.asyncio
+    async def test_unbounded_context_keeps_every_move(self):
+        game, prompts = await _play_window_game(self.PATH)
+
+        assert game.state.status == GameStatus.WON
+        last_prompt = prompts[-1]
+        assert sum(isinstance(m, AssistantMessage) for m in last_prompt) == len(self.PATH) - 1
+        assert not any("Previous moves" in (m.content or "") for m in last_prompt)
+        for prompt in prompts:
+            _assert_well_formed(prompt)
+
+    @pytest.mark.asyncio
+    async def test_max_context_turns_trims_and_summarizes_older_moves(self):
+        game, prompts = await _play_window_game(self.PATH, max_context_turns=2)
+
+        assert game.state.status == GameStatus.WON
+        for step, prompt in enumerate(prompts):
+            _assert_well_formed(prompt)
+            assert sum(isinstance(m, AssistantMessage) for m in prompt) == min(step, 2)
+
+        # The fifth prompt follows four moves: the oldest two are summarized, the last two are kept
+        last_prompt = prompts[-1]
+        assert last_prompt[1].content == "Previous moves: A -> B, B -> C"
+        assert [m.tool_calls[0].arguments["to_page_title"] for m in last_prompt if isinstance(m, AssistantMessage)] == ["A", "B"]
+        assert last_prompt[-1].content.startswith("You are now on the page 'B'.")
+
+    @pytest.mark.asyncio
+    async def test_zero_context_turns_sends_only_summary_and_current_page(self):
+        _, prompts = await _play_window_game(self.PATH, max_context_turns=0)
+
+        last_prompt = prompts[-1]
+        _assert_well_formed(last_prompt)
+        assert len(last_prompt) == 3
+        assert last_prompt[1].content == "Previous moves: A -> B, B -> C, C -> A, A -> B"
+
+    @pytest.mark.asyncio
+    async def test_token_budget_smaller_than_one_turn_keeps_no_moves(self):
+        game, prompts = await _play_window_game(self.PATH, max_context_tokens=1)
+
+        assert game.state.status == GameStatus.WON
+        # The system prompt and current page are always sent, even when they alone exceed the budget
+        assert len(prompts[0]) == 2
+        for prompt in prompts[1:]:
+            _assert_well_formed(prompt)
+            assert len(prompt) == 3
+            assert prompt[1].content.startswith("Previous moves: ")
+
+    @pytest.mark.asyncio
+    async def test_token_budget_keeps_the_most_recent_moves_that_fit(self):
+        _, full_prompts = await _play_window_game(self.PATH)
+        # Budget for the final prompt with only its latest move kept: the system prompt, the
+        # summary of the three older moves, the latest move and the current page
+        final = full_prompts[-1]
+        summary = UserMessage(content="Previous moves: A -> B, B -> C, C -> A")
+        budget = sum(_approx_tokens(m) for m in [final[0], summary, *final[-3:]])
+
+        _, prompts = await _play_window_game(self.PATH, max_context_tokens=budget)
+
+        last_prompt = prompts[-1]
+        _assert_well_formed(last_prompt)
+        assert [m.tool_calls[0].arguments["to_page_title"] for m in last_prompt if isinstance(m, AssistantMessage)] == ["B"]
+        assert last_prompt[1].content == summary.content
+        for prompt in prompts:
+            # Only the system prompt, the summary and the current page may exceed the budget
+            assert sum(_approx_tokens(m) for m in prompt) <= budget or len(prompt) <= 3
+
+    @pytest.mark.asyncio
+    async def test_old_link_listings_are_collapsed_in_the_prompt_but_kept_in_the_log(self):
+        game, prompts = await _play_window_game(self.PATH)
+
+        listing = "Here are the available links:"
+        assert sum(listing in (m.content or "") for m in prompts[-1]) == 1
+        assert sum(listing in (m.content or "") for m in game.state.context) == len(self.PATH)
+
+
+class TestGameEvents:
+    """Events the game queues on the bus while it plays."""
+
+    @pytest.mark.asyncio
+    async def test_final_move_is_delivered_before_game_ended(self):
+        bus = EventBus()
+        delivered = []
+
+        async def slow_move_handler(event):
+            # Slower than the game_ended handler, so out-of-order dispatch would show up here
+            await asyncio.sleep(0.01)
+            delivered.append((event.type, event.data["move"].to_page_title))
+
+        async def game_ended_handler(event):
+            delivered.append((event.type, event.data["game_state"].status))
+
+        bus.subscribe("move_completed", slow_move_handler)
+        bus.subscribe("game_ended", game_ended_handler)
+
+        game, _ = await _play_window_game(["B", "T"], event_bus=bus)
+        await bus.drain()
+
+        assert game.state.status == GameStatus.WON
+        assert delivered == [
+            ("move_completed", "B"),
+            ("move_completed", "T"),
+            ("game_ended", GameStatus.WON),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_run_publishes_game_started_when_the_game_begins(self):
+        bus = EventBus()
+        delivered = []
+
+        async def record(event):
+            delivered.append((event.type, event.data["game_state"].status))
+
+        for event_type in ("game_started", "move_completed", "game_ended"):
+            bus.subscribe(event_type, record)
+
+        game, _ = await _play_window_game(["B", "T"], event_bus=bus)
+        await bus.drain()
+
+        assert delivered == [
+            ("game_started", GameStatus.IN_PROGRESS),
+            ("move_completed", GameStatus.IN_PROGRESS),
+            ("move_completed", GameStatus.WON),
+            ("game_ended", GameStatus.WON),
+        ]
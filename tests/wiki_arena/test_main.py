@@ -0,0 +1,72 @@
+"""
+Tests for the command line batch runner, played offline on a small fake link graph.
+"""
+
+import json
+import logging
+
+import pytest
+from typer.testing import CliRunner
+
+from wiki_arena import main as cli
+from wiki_arena.types import Page, Task
+from wiki_arena.wikipedia import LiveWikiService
+from wiki_arena.wikipedia.task_selector import WikipediaTaskSelector
+
+# Small offline link graph; the random model always finds its way to D within max_steps
+BATCH_TEST_LINKS = {
+    "A": ["B"],
+    "B": ["C"],
+    "C": ["D"],
+    "D": ["A"],
+}
+
+
+@pytest.fixture
+def offline_batch(monkeypatch, tmp_path):
+    """Route task selection, page fetches and storage away from the network and the repo."""
+    selector_services = []
+
+    async def select_task_async(self):
+        selector_services.append(self.service)
+        return Task(start_page_title="A", target_page_title="D")
+
+    async def get_page(self, title, include_all_namespaces=False):
+        return Page(title=title, url=f"https://en.wikipedia.org/wiki/{title}", links=BATCH_TEST_LINKS[title])
+
+    monkeypatch.setattr(WikipediaTaskSelector, "select_task_async", select_task_async)
+    monkeypatch.setattr(LiveWikiService, "get_page", get_page)
+    monkeypatch.setenv("WIKI_ARENA_STORAGE_DIR", str(tmp_path))
+    # run_games_async configures logging itself; keep it from replacing pytest's handlers
+    monkeypatch.setattr("wiki_arena.logging_config.setup_logging", lambda level="INFO": None)
+    return tmp_path, selector_services
+
+
+@pytest.mark.asyncio
+async def test_run_games_async_plays_and_stores_every_game(offline_batch, caplog):
+    storage_dir, selector_services = offline_batch
+
+    with caplog.at_level(logging.INFO, logger="wiki_arena.main"):
+        await cli.run_games_async(n=5, model_id="wikiarena/random", max_steps=3, concurrency=2)
+
+    results = [
+        json.loads(line)
+        for path in storage_dir.rglob("*.jsonl")
+        for line in path.read_text().splitlines()
+    ]
+    assert len(results) == 5
+    assert len({result["game_id"] for result in results}) == 5
+    assert all(result["status"] == "won" for result in results)
+
+    # Every game selected its task through the batch's shared wiki service
+    assert len(selector_services) == 5
+    assert all(service is selector_services[0] for service in selector_services)
+
+    assert "Batch finished: 5/5 games completed." in caplog.text
+
+
+def test_cli_rejects_zero_concurrency():
+    result = CliRunner().invoke(cli.app, ["--games", "2", "--concurrency", "0"])
+
+    assert result.exit_code != 0
+    assert "concurrency" in result.output
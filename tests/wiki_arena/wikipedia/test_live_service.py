@@ -1,14 +1,21 @@
+import asyncio
 import pytest
+import pytest_asyncio
+from typing import AsyncIterator
+import httpx
 from wiki_arena.wikipedia.live_service import LiveWikiService
 from wiki_arena.types import Page
 
 # Mark all tests in this file as integration tests
 pytestmark = pytest.mark.integration
 
-@pytest.fixture(scope="module")
-def service() -> LiveWikiService:
+# The service's HTTP client is bound to the loop it was first used on, so each test gets its
+# own service, set up and closed on the test's event loop.
+@pytest_asyncio.fixture(loop_scope="function")
+async def service() -> AsyncIterator[LiveWikiService]:
     """Fixture to provide a LiveWikiService instance for tests."""
-    return LiveWikiService(language="en")
+    async with LiveWikiService(language="en") as live_service:
+        yield live_service
 
 @pytest.mark.asyncio
 async def test_get_random_pages(service: LiveWikiService):
@@ -86,4 +93,69 @@ async def test_get_page_redirect(service: LiveWikiService):
 async def test_get_page_not_found_raises_error(service: LiveWikiService):
     """Test that fetching a non-existent page raises a ValueError."""
     with pytest.raises(ValueError, match="Page does not exist"):
-        await service.get_page("PageThatDoesNotExist_ABC123XYZ") 
\ No newline at end of file
+        await service.get_page("PageThatDoesNotExist_ABC123XYZ")
+
+
+@pytest.mark.asyncio
+async def test_get_page_is_cached_under_requested_and_resolved_titles():
+    """Test that a fetched page is served from cache for both its redirect and canonical title."""
+    requested_titles = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested_titles.append(request.url.params["titles"])
+        return httpx.Response(200, json={
+            "query": {"pages": [{"title": "United States", "links": [{"title": "Washington, D.C."}]}]}
+        })
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        cached_service = LiveWikiService(language="en", client=client)
+
+        redirected = await cached_service.get_page("U.S.A.")
+        canonical = await cached_service.get_page("United States")
+        again = await cached_service.get_page("U.S.A.")
+
+    assert redirected is canonical is again
+    assert requested_titles == ["U.S.A."]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_get_page_misses_share_one_fetch():
+    """Test that simultaneous requests for an uncached page result in a single API call."""
+    requested_titles = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requested_titles.append(request.url.params["titles"])
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={
+            "query": {"pages": [{"title": "United States", "links": [{"title": "Washington, D.C."}]}]}
+        })
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        cached_service = LiveWikiService(language="en", client=client)
+        pages = await asyncio.gather(*(cached_service.get_page("United States") for _ in range(5)))
+
+    assert all(page is pages[0] for page in pages)
+    assert requested_titles == ["United States"]
+
+
+def test_owned_client_cannot_be_used_from_another_event_loop():
+    """Test that a service refuses to hand its loop-bound HTTP client to a different event loop."""
+    owned_service = LiveWikiService(language="en")
+    first_loop = asyncio.new_event_loop()
+
+    async def get_client():
+        return owned_service._get_client()
+
+    try:
+        client = first_loop.run_until_complete(get_client())
+
+        with pytest.raises(RuntimeError, match="different event loop"):
+            asyncio.run(get_client())
+
+        # The owning loop can still use and explicitly close it
+        assert first_loop.run_until_complete(get_client()) is client
+        first_loop.run_until_complete(owned_service.aclose())
+        assert client.is_closed
+        assert owned_service._client is None
+    finally:
+        first_loop.close()
@@ -1,4 +1,6 @@
 import pytest
+import pytest_asyncio
+from typing import AsyncIterator
 import asyncio
 from wiki_arena.wikipedia.live_service import LiveWikiService
 from wiki_arena.wikipedia.task_selector import (
@@ -19,10 +21,13 @@ FORBIDDEN_PREFIXES = {
     "Module:", "Draft:",
 }
 
-@pytest.fixture(scope="module")
-def service() -> LiveWikiService:
+# The service's HTTP client is bound to the loop it was first used on, so each test gets its
+# own service, set up and closed on the test's event loop.
+@pytest_asyncio.fixture(loop_scope="function")
+async def service() -> AsyncIterator[LiveWikiService]:
     """Fixture to provide a LiveWikiService instance for validation."""
-    return LiveWikiService(language="en")
+    async with LiveWikiService(language="en") as live_service:
+        yield live_service
 
 @pytest.fixture
 def selector(service: LiveWikiService) -> WikipediaTaskSelector: